@@ -3,24 +3,43 @@ Audit Log API endpoints.
 
 Related: Issue #9 - Enhance audit logging system
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, Response, ORJSONResponse
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List, Optional
 import csv
 import io
-import json
+import queue
+import orjson
 
-from backend.models.base import get_db
+from backend.models.base import get_db, AsyncSessionLocal
 from backend.models.user import User, UserRole
 from backend.models.audit import AuditLog
+from backend.core.cache import ResponseCache
+from backend.core.config import settings
 from backend.core.security import get_current_user, require_role
-from backend.services.audit import AuditLogService
+from backend.services.audit import AuditLogService, EXPORT_BATCH_SIZE
 
 router = APIRouter()
 
+# Serialized statistics keyed by window size in days
+_stats_cache = ResponseCache("audit_stats", ttl=settings.STATS_CACHE_TTL, maxsize=16)
+
+# Distinct action/resource_type values for filter dropdowns
+_filter_values_cache = ResponseCache("audit_filter_values", ttl=300, maxsize=4)
+
+
+def _json_default(obj):
+    """Serialize Decimal, the one export value type orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class AuditLogResponse(BaseModel):
     """Audit log response model."""
@@ -54,6 +73,120 @@ class AuditLogListResponse(BaseModel):
     offset: int
 
 
+# Field order used when rendering audit logs without Pydantic validation
+_AUDIT_LOG_FIELDS = tuple(AuditLogResponse.model_fields)
+
+
+def _serialize_log(log: AuditLog) -> dict:
+    """Render an audit log row as a plain dict matching AuditLogResponse."""
+    return {field: getattr(log, field) for field in _AUDIT_LOG_FIELDS}
+
+
+def _export_log(log: AuditLog) -> dict:
+    """Render an audit log row in the SIEM export format (datetimes left to orjson)."""
+    return {
+        "timestamp": log.created_at,
+        "user_id": log.user_id,
+        "username": log.username,
+        "action": log.action,
+        "resource_type": log.resource_type,
+        "resource_id": log.resource_id,
+        "resource_name": log.resource_name,
+        "ip_address": log.ip_address,
+        "user_agent": log.user_agent,
+        "request_method": log.request_method,
+        "request_path": log.request_path,
+        "request_data": log.request_data,
+        "response_status": log.response_status,
+        "response_message": log.response_message,
+        "duration_ms": log.duration_ms,
+        "severity": log.severity,
+        "tags": log.tags,
+        "metadata": log.audit_metadata
+    }
+
+
+# CSV export layout: only these columns are selected, no ORM rows are loaded
+CSV_EXPORT_HEADER = (
+    'Timestamp', 'User', 'Action', 'Resource Type', 'Resource ID',
+    'Resource Name', 'IP Address', 'Method', 'Path', 'Status',
+    'Duration (ms)', 'Severity', 'Message'
+)
+CSV_EXPORT_HEADER_LINE = ",".join(CSV_EXPORT_HEADER) + "\r\n"
+CSV_EXPORT_COLUMNS = (
+    AuditLog.created_at,
+    func.coalesce(AuditLog.username, User.username, 'SYSTEM'),
+    AuditLog.action,
+    AuditLog.resource_type,
+    AuditLog.resource_id,
+    AuditLog.resource_name,
+    AuditLog.ip_address,
+    AuditLog.request_method,
+    AuditLog.request_path,
+    AuditLog.response_status,
+    AuditLog.duration_ms,
+    AuditLog.severity,
+    AuditLog.response_message,
+)
+
+
+# Exports at least this large are fetched and serialized in bigger batches.
+# Every export uses csv.writer so the output does not depend on the limit.
+LARGE_CSV_MIN_LIMIT = 20000
+LARGE_CSV_BATCH_SIZE = 5000
+
+
+def _csv_row(row) -> tuple:
+    """Format a CSV_EXPORT_COLUMNS row; csv.writer renders None as an empty cell."""
+    return (row[0].isoformat(), *row[1:])
+
+
+# Export serializers below are CPU-bound and run in the threadpool, one batch per call.
+# CSV batches are written into pooled StringIO buffers shared across requests.
+_CSV_BUFFER_POOL: "queue.SimpleQueue[io.StringIO]" = queue.SimpleQueue()
+
+
+def _acquire_csv_buffer() -> io.StringIO:
+    """Take a reusable buffer from the pool, or allocate one if it is empty."""
+    try:
+        buffer = _CSV_BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return io.StringIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+def _serialize_csv_batch(rows: list) -> str:
+    """Render a batch of export rows as CSV text."""
+    buffer = _acquire_csv_buffer()
+    try:
+        csv.writer(buffer).writerows(map(_csv_row, rows))
+        return buffer.getvalue()
+    finally:
+        _CSV_BUFFER_POOL.put(buffer)
+
+
+def _serialize_json_batch(logs: List[AuditLog]) -> bytes:
+    """Render a batch of audit logs as comma-separated JSON objects."""
+    return b",".join(
+        orjson.dumps(_export_log(log), default=_json_default, option=orjson.OPT_NAIVE_UTC)
+        for log in logs
+    )
+
+
+def _serialize_ndjson_batch(logs: List[AuditLog]) -> bytes:
+    """Render a batch of audit logs as newline-delimited JSON."""
+    return b"".join(
+        orjson.dumps(
+            _export_log(log),
+            default=_json_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE
+        )
+        for log in logs
+    )
+
+
 class AuditStatsResponse(BaseModel):
     """Audit log statistics response."""
     total_logs: int
@@ -64,7 +197,7 @@ class AuditStatsResponse(BaseModel):
     end_date: Optional[str]
 
 
-@router.get("", response_model=AuditLogListResponse)
+@router.get("", response_class=ORJSONResponse, responses={200: {"model": AuditLogListResponse}})
 async def list_audit_logs(
     user_id: Optional[int] = None,
     action: Optional[str] = None,
@@ -76,10 +209,16 @@ async def list_audit_logs(
     ip_address: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    exact_count: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_role(UserRole.ADMIN))
 ):
-    """Query audit logs with filters."""
+    """
+    Query audit logs with filters.
+
+    Totals above a few thousand rows are planner estimates unless
+    ``exact_count`` is set.
+    """
     audit_service = AuditLogService(db)
     logs, total = await audit_service.query_logs(
         user_id=user_id,
@@ -91,18 +230,19 @@ async def list_audit_logs(
         end_date=end_date,
         ip_address=ip_address,
         limit=limit,
-        offset=offset
+        offset=offset,
+        exact_count=exact_count
     )
 
-    return {
-        "logs": logs,
+    return ORJSONResponse({
+        "logs": [_serialize_log(log) for log in logs],
         "total": total,
         "limit": limit,
         "offset": offset
-    }
+    })
 
 
-@router.get("/recent")
+@router.get("/recent", response_class=ORJSONResponse)
 async def get_recent_activity(
     user_id: Optional[int] = None,
     limit: int = 50,
@@ -120,26 +260,62 @@ async def get_recent_activity(
         limit=limit
     )
 
-    return {"logs": [AuditLogResponse.from_orm(log) for log in logs]}
+    return ORJSONResponse({"logs": [_serialize_log(log) for log in logs]})
 
 
-@router.get("/statistics", response_model=AuditStatsResponse)
+@router.get("/statistics", response_class=ORJSONResponse, responses={200: {"model": AuditStatsResponse}})
 async def get_audit_statistics(
     days: int = 30,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_role(UserRole.ADMIN))
 ):
     """Get audit log statistics."""
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=days)
+    headers = {"Cache-Control": f"private, max-age={settings.STATS_CACHE_TTL}"}
 
-    audit_service = AuditLogService(db)
-    stats = await audit_service.get_statistics(
-        start_date=start_date,
-        end_date=end_date
-    )
+    body = await _stats_cache.get(days)
+    if body is None:
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+
+        audit_service = AuditLogService(db)
+        stats = await audit_service.get_statistics(
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        body = orjson.dumps(stats)
+        await _stats_cache.set(days, body)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/actions", response_class=ORJSONResponse)
+async def get_available_actions(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """List distinct audit actions for filter dropdowns."""
+    return await _distinct_values_response(db, "action")
+
+
+@router.get("/resource-types", response_class=ORJSONResponse)
+async def get_available_resource_types(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """List distinct audit resource types for filter dropdowns."""
+    return await _distinct_values_response(db, "resource_type")
 
-    return stats
+
+async def _distinct_values_response(db: AsyncSession, column: str) -> Response:
+    """Serve distinct column values, cached since they change rarely."""
+    body = await _filter_values_cache.get(column)
+    if body is None:
+        values = await AuditLogService(db).get_distinct_values(column)
+        body = orjson.dumps(values)
+        await _filter_values_cache.set(column, body)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/export/csv")
@@ -155,53 +331,36 @@ async def export_audit_logs_csv(
     current_user: User = Depends(require_role(UserRole.ADMIN))
 ):
     """Export audit logs to CSV for compliance reports."""
-    audit_service = AuditLogService(db)
-    logs, _ = await audit_service.query_logs(
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        severity=severity,
-        start_date=start_date,
-        end_date=end_date,
-        limit=limit,
-        offset=0
-    )
+    filename = f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        'Timestamp', 'User', 'Action', 'Resource Type', 'Resource ID',
-        'Resource Name', 'IP Address', 'Method', 'Path', 'Status',
-        'Duration (ms)', 'Severity', 'Message'
-    ])
-
-    # Write rows
-    for log in logs:
-        writer.writerow([
-            log.created_at.isoformat(),
-            log.username or 'SYSTEM',
-            log.action,
-            log.resource_type or '',
-            log.resource_id or '',
-            log.resource_name or '',
-            log.ip_address or '',
-            log.request_method or '',
-            log.request_path or '',
-            log.response_status or '',
-            log.duration_ms or '',
-            log.severity,
-            log.response_message or ''
-        ])
+    batch_size = LARGE_CSV_BATCH_SIZE if limit >= LARGE_CSV_MIN_LIMIT else EXPORT_BATCH_SIZE
+
+    async def generate_csv():
+        # The request session is closed before a streamed body is sent,
+        # so the export reads through its own session.
+        async with AsyncSessionLocal() as session:
+            audit_service = AuditLogService(session)
+
+            # Write header
+            yield CSV_EXPORT_HEADER_LINE
+
+            # Serialize each fetched batch off the event loop; DB reads stay on it
+            async for batch in audit_service.stream_row_batches(
+                CSV_EXPORT_COLUMNS,
+                user_id=user_id,
+                action=action,
+                resource_type=resource_type,
+                severity=severity,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+                batch_size=batch_size
+            ):
+                yield await run_in_threadpool(_serialize_csv_batch, batch)
 
     # Return as downloadable CSV
-    output.seek(0)
-    filename = f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate_csv(),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -220,59 +379,79 @@ async def export_audit_logs_json(
     current_user: User = Depends(require_role(UserRole.ADMIN))
 ):
     """Export audit logs to JSON for SIEM ingestion."""
-    audit_service = AuditLogService(db)
-    logs, total = await audit_service.query_logs(
+    filters = dict(
         user_id=user_id,
         action=action,
         resource_type=resource_type,
         severity=severity,
         start_date=start_date,
-        end_date=end_date,
-        limit=limit,
-        offset=0
+        end_date=end_date
     )
+    exported_at = datetime.now(timezone.utc)
+    filename = f"audit_logs_{exported_at.strftime('%Y%m%d_%H%M%S')}.json"
 
-    # Convert to JSON-serializable format
-    logs_data = []
-    for log in logs:
-        logs_data.append({
-            "timestamp": log.created_at.isoformat(),
-            "user_id": log.user_id,
-            "username": log.username,
-            "action": log.action,
-            "resource_type": log.resource_type,
-            "resource_id": log.resource_id,
-            "resource_name": log.resource_name,
-            "ip_address": log.ip_address,
-            "user_agent": log.user_agent,
-            "request_method": log.request_method,
-            "request_path": log.request_path,
-            "request_data": log.request_data,
-            "response_status": log.response_status,
-            "response_message": log.response_message,
-            "duration_ms": log.duration_ms,
-            "severity": log.severity,
-            "tags": log.tags,
-            "metadata": log.audit_metadata
-        })
-
-    result = {
-        "total": total,
-        "count": len(logs_data),
-        "exported_at": datetime.utcnow().isoformat(),
-        "logs": logs_data
-    }
+    async def generate_json():
+        # Emit the envelope incrementally so only one batch is held at a time
+        async with AsyncSessionLocal() as session:
+            audit_service = AuditLogService(session)
+            total = await audit_service.count_logs(**filters)
+
+            yield b'{"total":' + orjson.dumps(total)
+            yield b',"exported_at":' + orjson.dumps(exported_at)
+            yield b',"logs":['
+
+            count = 0
+            async for batch in audit_service.stream_log_batches(**filters, limit=limit):
+                chunk = await run_in_threadpool(_serialize_json_batch, batch)
+                yield (b"," if count else b"") + chunk
+                count += len(batch)
 
-    filename = f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+            yield b'],"count":' + orjson.dumps(count) + b"}"
 
     return StreamingResponse(
-        iter([json.dumps(result, indent=2)]),
+        generate_json(),
         media_type="application/json",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
-@router.get("/{log_id}", response_model=AuditLogResponse)
+@router.get("/export/ndjson")
+async def export_audit_logs_ndjson(
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    severity: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    limit: int = 10000,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """Export audit logs as newline-delimited JSON (one event per line) for SIEM ingestion."""
+    filename = f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.ndjson"
+
+    async def generate_ndjson():
+        async with AsyncSessionLocal() as session:
+            audit_service = AuditLogService(session)
+            async for batch in audit_service.stream_log_batches(
+                user_id=user_id,
+                action=action,
+                resource_type=resource_type,
+                severity=severity,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit
+            ):
+                yield await run_in_threadpool(_serialize_ndjson_batch, batch)
+
+    return StreamingResponse(
+        generate_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+@router.get("/{log_id}", response_class=ORJSONResponse, responses={200: {"model": AuditLogResponse}})
 async def get_audit_log(
     log_id: int,
     db: AsyncSession = Depends(get_db),
@@ -286,4 +465,4 @@ async def get_audit_log(
             detail="Audit log not found"
         )
 
-    return log
+    return ORJSONResponse(_serialize_log(log))
@@ -2,24 +2,31 @@
 Authentication API endpoints.
 """
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, EmailStr
+from sqlalchemy.orm.attributes import set_committed_value
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 from backend.models.base import get_db
 from backend.models.user import User, UserRole
 from backend.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_and_update_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     get_current_user,
     decode_token
 )
 from backend.core.config import settings
-from backend.services.audit_logger import AuditLogger
+from backend.core.rate_limit import (
+    enforce_login_rate_limit,
+    record_login_failure,
+    clear_login_failures
+)
+from backend.services.audit_logger import AuditLogger, log_detached
+from backend.services.login_tracking import record_last_login
 
 router = APIRouter()
 
@@ -49,8 +56,7 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LoginResponse(BaseModel):
@@ -64,19 +70,30 @@ class LoginResponse(BaseModel):
 async def _authenticate_user(
     form_data: OAuth2PasswordRequestForm,
     db: AsyncSession,
-    request: Request
+    request: Request,
+    background_tasks: BackgroundTasks
 ):
     """Helper function to authenticate user."""
     audit_logger = AuditLogger(db)
     ip_address = request.client.host if request.client else "unknown"
     user_agent = request.headers.get("user-agent")
 
+    # Shed excess attempts before any password hashing
+    await enforce_login_rate_limit(ip_address, form_data.username)
+
     # Get user by username
     stmt = select(User).where(User.username == form_data.username)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(stmt)
+
+    valid, new_password_hash = (False, None)
+    if user:
+        valid, new_password_hash = await verify_and_update_password_async(
+            form_data.password, user.password_hash
+        )
+
+    if not valid:
+        await record_login_failure(form_data.username)
 
-    if not user or not verify_password(form_data.password, user.password_hash):
         # Log failed login attempt (Issue #9)
         await audit_logger.log_authentication(
             action="LOGIN",
@@ -109,12 +126,24 @@ async def _authenticate_user(
             detail="Inactive user",
         )
 
-    # Update last login
-    user.last_login = datetime.utcnow()
-    await db.commit()
+    await clear_login_failures(form_data.username)
+
+    # Upgrade legacy (bcrypt) hashes to the current scheme
+    if new_password_hash:
+        user.password_hash = new_password_hash
+        await db.commit()
 
-    # Log successful login (Issue #9)
-    await audit_logger.log_authentication(
+    # Update last login (written in batches by the worker; shown in the
+    # response immediately without marking the user dirty)
+    last_login = datetime.utcnow()
+    set_committed_value(user, "last_login", last_login)
+    await record_last_login(db, user.id, last_login)
+
+    # Log successful login after the response is sent (Issue #9); failures
+    # above are logged inline since background tasks are dropped on errors
+    background_tasks.add_task(
+        log_detached,
+        AuditLogger.log_authentication,
         action="LOGIN",
         username=user.username,
         success=True,
@@ -127,9 +156,6 @@ async def _authenticate_user(
     access_token = create_access_token(data={"sub": user.username})
     refresh_token = create_refresh_token(data={"sub": user.username})
 
-    # Refresh user to ensure all fields are loaded
-    await db.refresh(user)
-
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -141,46 +167,47 @@ async def _authenticate_user(
 @router.post("/token", response_model=Token)
 async def token(
     request: Request,
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
 ):
     """OAuth2 compatible token endpoint."""
-    return await _authenticate_user(form_data, db, request)
+    return await _authenticate_user(form_data, db, request, background_tasks)
 
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
     request: Request,
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
 ):
     """Authenticate user and return JWT tokens with user data."""
-    return await _authenticate_user(form_data, db, request)
+    return await _authenticate_user(form_data, db, request, background_tasks)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     request: Request,
     user_data: UserCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Register a new user."""
-    audit_logger = AuditLogger(db)
     ip_address = request.client.host if request.client else "unknown"
 
-    # Check if username exists
-    stmt = select(User).where(User.username == user_data.username)
+    # Check if username or email exists (one round-trip)
+    stmt = select(User.username, User.email).where(
+        or_(User.username == user_data.username, User.email == user_data.email)
+    )
     result = await db.execute(stmt)
-    if result.scalar_one_or_none():
+    existing = result.all()
+    if any(row.username == user_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists"
         )
-
-    # Check if email exists
-    stmt = select(User).where(User.email == user_data.email)
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
@@ -190,7 +217,7 @@ async def register(
     user = User(
         username=user_data.username,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash_async(user_data.password),
         role=user_data.role,
         is_active=True
     )
@@ -199,8 +226,10 @@ async def register(
     await db.commit()
     await db.refresh(user)
 
-    # Log user registration (Issue #9)
-    await audit_logger.log_configuration_change(
+    # Log user registration after the response is sent (Issue #9)
+    background_tasks.add_task(
+        log_detached,
+        AuditLogger.log_configuration_change,
         action="CREATE",
         user_id=user.id,
         resource_type="USER",
@@ -221,16 +250,17 @@ async def get_me(current_user: User = Depends(get_current_user)):
 @router.post("/logout")
 async def logout(
     request: Request,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
 ):
     """Logout user (client should discard tokens)."""
-    audit_logger = AuditLogger(db)
     ip_address = request.client.host if request.client else "unknown"
     user_agent = request.headers.get("user-agent")
 
-    # Log logout (Issue #9)
-    await audit_logger.log_authentication(
+    # Log logout after the response is sent (Issue #9)
+    background_tasks.add_task(
+        log_detached,
+        AuditLogger.log_authentication,
         action="LOGOUT",
         username=current_user.username,
         success=True,
@@ -278,8 +308,7 @@ async def refresh_access_token(
 
         # Get user from database
         stmt = select(User).where(User.username == username)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await db.scalar(stmt)
 
         if not user:
             raise HTTPException(
@@ -1,23 +1,45 @@
 """
 Backup API endpoints.
 """
+import base64
+import logging
+import binascii
 from datetime import datetime, timedelta
-from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
+from functools import partial
+from uuid import UUID, uuid4
+import anyio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import select, insert, and_, exists, func, literal, text, tuple_
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional, Generic, TypeVar
 
-from backend.models.base import get_db
+from backend.models.base import get_db, AsyncSessionLocal
 from backend.models.user import User, UserRole
-from backend.models.backup import Backup, BackupStatus, BackupMode, ScheduleType, SourceType
-from backend.models.infrastructure import VM, Container
-from backend.models.settings import SystemSetting
+from backend.models.backup import (
+    Backup, BackupStatus, BackupMode, ScheduleType, SourceType, RetentionMode,
+    Job, JobType, JobStatus
+)
+from backend.models.infrastructure import VM, Container, KVMHost, PodmanHost
+from backend.core.cache import ResponseCache
 from backend.core.security import get_current_user, require_role
+from backend.services.backup_chain import BackupChainService
+from backend.services.immutability import ImmutabilityService, ImmutabilityError
+from backend.services.settings import get_system_setting
+from backend.worker import execute_backup, execute_restore, reclaim_backup_storage, verify_backup
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# JSON endpoints encode with orjson; list/get/trigger already return
+# pre-serialized bodies
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Serialized get_backup responses keyed by backup ID. The worker updates
+# backup status without invalidating this, so entries are short-lived.
+_backup_cache = ResponseCache("backup", ttl=10, maxsize=256)
 
 # Generic paginated response
 T = TypeVar('T')
@@ -25,9 +47,11 @@ T = TypeVar('T')
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response model."""
     items: List[T]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class BackupResponse(BaseModel):
@@ -71,9 +95,90 @@ class BackupResponse(BaseModel):
     storage_encryption_type: Optional[str] = "NONE"
     storage_encryption_key_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-        json_schema_mode_override = "serialization"
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_mode_override="serialization"
+    )
+
+
+# Validates/serializes whole batches of backups in one pydantic-core call
+BACKUP_LIST_ADAPTER = TypeAdapter(List[BackupResponse])
+
+# BackupResponse fields read straight from Backup columns (job_id is derived)
+BACKUP_RESPONSE_FIELDS = tuple(field for field in BackupResponse.model_fields if field != "job_id")
+
+# Columns selected for backup listings: the BackupResponse fields plus the
+# linked job ID, so list pages never materialize Backup/Job ORM objects
+_BACKUP_JOB_ID = (
+    select(Job.id)
+    .where(Job.backup_id == Backup.id)
+    .order_by(Job.id)
+    .limit(1)
+    .correlate(Backup)
+    .scalar_subquery()
+    .label("job_id")
+)
+BACKUP_LIST_COLUMNS = tuple(getattr(Backup, field) for field in BACKUP_RESPONSE_FIELDS) + (_BACKUP_JOB_ID,)
+
+# Rows fetched per round-trip when streaming backup listings
+BACKUP_LIST_BATCH_SIZE = 50
+
+# Listing totals keyed by status filter. Counting the filtered set is the
+# dominant cost of a page on large tables, and a total that lags by a few
+# seconds is fine for paging controls.
+_backup_count_cache = ResponseCache("backup_count", ttl=30, maxsize=16)
+
+# Above this many rows the unfiltered total is the planner's estimate
+BACKUP_EXACT_COUNT_LIMIT = 100_000
+
+
+async def _count_backups(db: AsyncSession, status: Optional[BackupStatus], filters: list) -> int:
+    """Return the (cached, possibly estimated) number of listed backups."""
+    key = status.value if status else "all"
+    cached = await _backup_count_cache.get(key)
+    if cached is not None:
+        return int(cached)
+
+    total = None
+    if not filters:
+        estimate = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'backups'::regclass")
+        )
+        if estimate and estimate > BACKUP_EXACT_COUNT_LIMIT:
+            total = estimate
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Backup).where(*filters))
+
+    await _backup_count_cache.set(key, str(total).encode())
+    return total
+
+
+async def _enqueue(task, args: tuple = (), kwargs: Optional[dict] = None, **options):
+    """
+    Send a Celery task from a worker thread.
+
+    Publishing is a blocking broker round-trip; running it off the event
+    loop keeps a slow broker from stalling other requests.
+    """
+    return await anyio.to_thread.run_sync(partial(task.apply_async, args, kwargs, **options))
+
+
+def _encode_list_cursor(created_at: datetime, backup_id: int) -> str:
+    """Encode a backup list position as an opaque keyset cursor."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{backup_id}".encode()).decode()
+
+
+def _decode_list_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a keyset cursor into (created_at, backup_id)."""
+    try:
+        created_at, backup_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(backup_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 
 class TriggerBackupRequest(BaseModel):
@@ -88,26 +193,26 @@ class TriggerBackupRequest(BaseModel):
     excluded_disks: Optional[list[str]] = Field(None, description="List of disk targets/paths to exclude from backup")
 
 
-async def find_parent_backup(
-    source_type: SourceType,
-    source_id: int,
-    db: AsyncSession
-) -> Optional[Backup]:
-    """Find the most recent completed FULL backup for the given source."""
-    stmt = select(Backup).where(
+def parent_backup_query(source_type: SourceType, source_id: int):
+    """Select the ID of the most recent completed FULL backup for the given source."""
+    # Mode and status are rendered inline so the planner can match the
+    # ix_backups_parent_lookup partial index even with generic plans
+    return select(Backup.id).where(
         and_(
             Backup.source_type == source_type,
             Backup.source_id == source_id,
-            Backup.backup_mode == BackupMode.FULL,
-            Backup.status == BackupStatus.COMPLETED
+            Backup.backup_mode == literal(BackupMode.FULL, Backup.backup_mode.type, literal_execute=True),
+            Backup.status == literal(BackupStatus.COMPLETED, Backup.status.type, literal_execute=True)
         )
     ).order_by(Backup.completed_at.desc()).limit(1)
 
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
 
-
-@router.post("/trigger", response_model=BackupResponse, status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/trigger",
+    response_class=Response,
+    responses={202: {"model": BackupResponse}},
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def trigger_backup(
     request: TriggerBackupRequest,
     db: AsyncSession = Depends(get_db),
@@ -119,59 +224,56 @@ async def trigger_backup(
     For INCREMENTAL backups, the system automatically finds the most recent FULL backup
     as the parent. If no parent backup exists, returns an error.
     """
-    # Validate source exists
-    if request.source_type == SourceType.VM:
-        source = await db.get(VM, request.source_id)
-        if not source:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"VM with ID {request.source_id} not found"
-            )
-        source_name = source.name
-    elif request.source_type == SourceType.CONTAINER:
-        source = await db.get(Container, request.source_id)
-        if not source:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Container with ID {request.source_id} not found"
-            )
-        source_name = source.name
-    else:
+    source_model = {SourceType.VM: VM, SourceType.CONTAINER: Container}.get(request.source_type)
+    if source_model is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid source_type: {request.source_type}"
         )
 
-    # For incremental backups, find parent backup
+    # Validate source exists and, for incremental backups, find the parent
+    # backup in the same round-trip
+    is_incremental = request.backup_mode == BackupMode.INCREMENTAL
+    stmt = select(source_model.name).where(source_model.id == request.source_id)
+    if is_incremental:
+        stmt = stmt.add_columns(
+            parent_backup_query(request.source_type, request.source_id).scalar_subquery()
+        )
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{source_model.__name__} with ID {request.source_id} not found"
+        )
+    source_name = row[0]
+
     parent_backup_id = None
-    if request.backup_mode == BackupMode.INCREMENTAL:
-        parent_backup = await find_parent_backup(request.source_type, request.source_id, db)
-        if not parent_backup:
+    if is_incremental:
+        parent_backup_id = row[1]
+        if parent_backup_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"No parent FULL backup found for {request.source_type} {source_name}. "
                        "Create a FULL backup first before running incremental backups."
             )
-        parent_backup_id = parent_backup.id
 
     # Get retention period
     retention_days = request.retention_days
     if retention_days is None:
-        # Load from system settings
-        stmt = select(SystemSetting).where(SystemSetting.key == "default_one_time_retention_days")
-        result = await db.execute(stmt)
-        setting = result.scalar_one_or_none()
-        retention_days = int(setting.value) if setting else 30
+        # Load from system settings (cached)
+        retention_days = int(await get_system_setting(db, "default_one_time_retention_days", default=30))
 
-    # Calculate expiration date
-    expires_at = datetime.utcnow() + timedelta(days=retention_days)
+    # Calculate expiration date (one clock read for expiry and metadata)
+    triggered_at = datetime.utcnow()
+    expires_at = triggered_at + timedelta(days=retention_days)
 
     # Create backup record
     backup_metadata = {
         "one_time": True,
         "encryption_enabled": request.encryption_enabled,
         "triggered_by": current_user.username,
-        "triggered_at": datetime.utcnow().isoformat()
+        "triggered_at": triggered_at.isoformat()
     }
 
     # Add compression_algorithm to metadata if provided
@@ -182,7 +284,9 @@ async def trigger_backup(
     if request.excluded_disks:
         backup_metadata["excluded_disks"] = request.excluded_disks
 
-    backup = Backup(
+    # INSERT ... RETURNING loads every column (including defaults) into
+    # the Backup object, so no refresh is needed for the response
+    stmt = insert(Backup).values(
         schedule_id=None,  # One-time backup has no schedule
         source_type=request.source_type,
         source_id=request.source_id,
@@ -194,82 +298,168 @@ async def trigger_backup(
         storage_backend_id=request.storage_backend_id,
         expires_at=expires_at,
         backup_metadata=backup_metadata
-    )
-
-    db.add(backup)
-    await db.commit()
-    await db.refresh(backup)
-
-    # Queue backup job via Celery
-    from backend.worker import execute_backup
-    task = execute_backup.delay(None, backup.id)  # schedule_id is None for one-time backups
+    ).returning(Backup)
 
-    # Update backup with task ID
-    from backend.models.backup import Job, JobType, JobStatus
+    # The Celery task ID is chosen up front so the backup and its job are
+    # written in one transaction, committed before the worker looks them up
+    task_id = str(uuid4())
+    backup = await db.scalar(stmt)
     job = Job(
         type=JobType.BACKUP,
         status=JobStatus.PENDING,
         backup_id=backup.id,
-        celery_task_id=task.id
+        celery_task_id=task_id
     )
     db.add(job)
     await db.commit()
 
-    # Re-fetch backup with job relationship eagerly loaded for response serialization
-    stmt = select(Backup).options(selectinload(Backup.job)).where(Backup.id == backup.id)
-    result = await db.execute(stmt)
-    backup = result.scalar_one()
+    # Queue backup job via Celery (schedule_id is None for one-time backups)
+    try:
+        await _enqueue(execute_backup, (None, backup.id), task_id=task_id)
+    except Exception as e:
+        backup.status = BackupStatus.FAILED
+        backup.error_message = f"Failed to queue backup: {e}"
+        job.status = JobStatus.FAILED
+        job.error_message = backup.error_message
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to queue backup job"
+        )
 
-    return backup
+    # Attach the job we just created for response serialization
+    set_committed_value(backup, "job", job)
+
+    # Serialized directly; FastAPI would re-validate the model and then
+    # encode a dict with the stdlib json module
+    return Response(
+        content=BackupResponse.model_validate(backup).model_dump_json(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json"
+    )
 
 
-@router.get("", response_model=PaginatedResponse[BackupResponse])
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={200: {"model": PaginatedResponse[BackupResponse]}}
+)
 async def list_backups(
     status: Optional[BackupStatus] = None,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000),
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List backups with optional filtering."""
-    # Build base query with eager loading for job relationship
-    stmt = select(Backup).options(selectinload(Backup.job))
-    if status:
-        stmt = stmt.where(Backup.status == status)
-
-    # Get total count (without options for efficiency)
-    count_stmt = select(func.count()).select_from(select(Backup).where(Backup.status == status).subquery() if status else Backup)
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar_one()
+    """
+    List backups with optional filtering, newest first.
 
-    # Get paginated items
-    stmt = stmt.order_by(Backup.created_at.desc()).limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    items = result.scalars().all()
+    Pages can be requested by ``offset`` or, for deep pagination, by passing
+    the ``next_cursor`` of the previous page as ``cursor`` (``offset`` is
+    then ignored). ``has_more`` tells whether another page exists;
+    ``next_cursor`` is null on the last page. Clients paging by cursor can
+    pass ``include_total=false`` to skip counting the filtered set
+    (``total`` is then null).
 
-    return PaginatedResponse(items=items, total=total, limit=limit, offset=offset)
+    ``total`` is cached for up to 30 seconds, and for very large tables
+    the unfiltered total is the planner's row estimate.
 
+    Items are read from a server-side cursor and serialized as they arrive,
+    so a page is never held in memory all at once.
+    """
+    filters = []
+    if status:
+        # Rendered inline so the planner can use the per-status partial
+        # indexes even with generic plans for prepared statements
+        filters.append(Backup.status == literal(status, Backup.status.type, literal_execute=True))
+
+    total = None
+    if include_total:
+        total = await _count_backups(db, status, filters)
+
+    # Select only the response columns (job ID via correlated subquery),
+    # plus created_at for the next page cursor. One extra row is fetched to
+    # tell whether another page exists.
+    order = (Backup.created_at.desc(), Backup.id.desc())
+    stmt = select(*BACKUP_LIST_COLUMNS, Backup.created_at)
+    if cursor:
+        stmt = stmt.where(
+            *filters,
+            tuple_(Backup.created_at, Backup.id) < tuple_(*_decode_list_cursor(cursor))
+        ).order_by(*order).limit(limit + 1)
+    else:
+        # Deferred join: find the page's IDs with an index-only scan, then
+        # read full rows (and job IDs) only for those, not for skipped rows
+        page_ids = select(Backup.id).where(*filters).order_by(*order).limit(limit + 1).offset(offset)
+        stmt = stmt.where(Backup.id.in_(page_ids)).order_by(*order)
+
+    async def generate_page():
+        # The request session is closed before a streamed body is sent,
+        # so rows are read through a dedicated session.
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                stmt,
+                execution_options={"stream_results": True, "yield_per": BACKUP_LIST_BATCH_SIZE}
+            )
 
-@router.get("/{backup_id}", response_model=BackupResponse)
+            yield b'{"items":['
+            count = 0
+            last = None
+            has_more = False
+            async for partition in result.partitions():
+                if count + len(partition) > limit:
+                    partition = partition[:limit - count]
+                    has_more = True
+                if partition:
+                    items = BACKUP_LIST_ADAPTER.validate_python(partition, from_attributes=True)
+                    # Strip the enclosing brackets so batches join into one array
+                    chunk = BACKUP_LIST_ADAPTER.dump_json(items)[1:-1]
+                    yield chunk if count == 0 else b"," + chunk
+                    count += len(partition)
+                    last = partition[-1]
+                if has_more:
+                    break
+
+            next_cursor = "null"
+            if has_more:
+                next_cursor = f'"{_encode_list_cursor(last.created_at, last.id)}"'
+            yield (
+                f'],"total":{"null" if total is None else total},"limit":{limit},'
+                f'"offset":{offset},"has_more":{"true" if has_more else "false"},'
+                f'"next_cursor":{next_cursor}}}'
+            ).encode()
+
+    return StreamingResponse(generate_page(), media_type="application/json")
+
+
+@router.get("/{backup_id}", response_class=Response, responses={200: {"model": BackupResponse}})
 async def get_backup(
     backup_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get backup details."""
-    # Use query with eager loading for job relationship
-    stmt = select(Backup).options(selectinload(Backup.job)).where(Backup.id == backup_id)
-    result = await db.execute(stmt)
-    backup = result.scalar_one_or_none()
-    if not backup:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Backup not found"
-        )
-    return backup
+    body = await _backup_cache.get(backup_id)
+    if body is None:
+        # Select only the response columns (job ID via correlated subquery)
+        stmt = select(*BACKUP_LIST_COLUMNS).where(Backup.id == backup_id)
+        result = await db.execute(stmt)
+        row = result.one_or_none()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Backup not found"
+            )
+
+        body = BackupResponse.model_validate(row).model_dump_json().encode()
+        await _backup_cache.set(backup_id, body)
 
+    return Response(content=body, media_type="application/json")
 
-@router.delete("/{backup_id}", status_code=status.HTTP_204_NO_CONTENT)
+
+@router.delete("/{backup_id}", status_code=status.HTTP_202_ACCEPTED)
 async def delete_backup(
     backup_id: int,
     override_governance: bool = False,
@@ -279,6 +469,9 @@ async def delete_backup(
     """
     Delete a backup.
 
+    The backup is marked DELETING and removed from storage and the database
+    by a background task.
+
     Args:
         backup_id: ID of backup to delete
         override_governance: If True, bypass GOVERNANCE mode retention (admin only)
@@ -289,7 +482,9 @@ async def delete_backup(
 
     Related: Issue #13 - Immutable Backup Support
     """
-    backup = await db.get(Backup, backup_id)
+    # Backup and its chain dependencies (Issue #10) are loaded in one query
+    chain_service = BackupChainService(db)
+    backup, can_delete_chain, chain_reason = await chain_service.get_backup_for_delete(backup_id)
     if not backup:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -297,12 +492,9 @@ async def delete_backup(
         )
 
     # Check immutability protection (Issue #13)
-    from backend.services.immutability import ImmutabilityService
-    immutability_service = ImmutabilityService(db)
-
     is_admin = current_user.role == UserRole.ADMIN
-    can_delete, reason = await immutability_service.can_delete_backup(
-        backup_id,
+    can_delete, reason = ImmutabilityService(db).check_can_delete(
+        backup,
         is_admin=is_admin,
         override_governance=override_governance
     )
@@ -313,47 +505,45 @@ async def delete_backup(
             detail=f"Cannot delete backup: {reason}"
         )
 
-    # Check backup chain dependencies (Issue #10)
-    from backend.services.backup_chain import BackupChainService
-    chain_service = BackupChainService(db)
-    can_delete_chain, chain_reason = await chain_service.can_delete_backup(backup_id)
-
     if not can_delete_chain:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Cannot delete backup: {chain_reason}. Delete dependent backups first."
         )
 
-    # Delete from storage
-    if backup.storage_path:
-        from backend.services.storage import create_storage_backend
-        from backend.models.storage import StorageBackend as StorageBackendModel
-
-        storage_backend = await db.get(StorageBackendModel, backup.storage_backend_id)
-        if storage_backend:
-            storage = create_storage_backend(storage_backend.type, storage_backend.config)
+    # Deletion already queued
+    if backup.status == BackupStatus.DELETING:
+        return {
+            "message": "Backup deletion already queued",
+            "backup_id": backup_id
+        }
 
-            # For S3 with Object Lock, pass override flag
-            if storage_backend.type == "s3":
-                await storage.delete(backup.storage_path, bypass_governance=override_governance and is_admin)
-            else:
-                await storage.delete(backup.storage_path)
+    # Mark as deleting and reclaim storage in the worker, so the response
+    # does not wait on remote storage
+    previous_status = backup.status
+    backup.status = BackupStatus.DELETING
+    await db.commit()
+    await _backup_cache.invalidate(backup_id)
 
-    # Delete from database (may be blocked by PostgreSQL trigger)
     try:
-        await db.delete(backup)
+        task = await _enqueue(
+            reclaim_backup_storage,
+            (backup_id, previous_status.value),
+            {"bypass_governance": override_governance and is_admin}
+        )
+    except Exception:
+        backup.status = previous_status
         await db.commit()
-    except Exception as e:
-        await db.rollback()
-        # Database trigger blocked deletion
-        if "immutable" in str(e).lower() or "COMPLIANCE" in str(e) or "LEGAL_HOLD" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Database protection: {str(e)}"
-            )
-        raise
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to queue backup deletion"
+        )
 
-    return None
+    return {
+        "message": "Backup deletion queued",
+        "backup_id": backup_id,
+        "task_id": task.id
+    }
 
 
 class RestoreBackupRequest(BaseModel):
@@ -378,56 +568,50 @@ async def restore_backup(
     The restore operation is queued as a background job and processed asynchronously.
     You can monitor the progress via the /jobs endpoint.
     """
-    backup = await db.get(Backup, backup_id)
-    if not backup:
+    # Fetch the backup's status/source type and, if a target host is given,
+    # check it exists in the same round-trip (the host table depends on the
+    # backup source type)
+    stmt = select(Backup.status, Backup.source_type).where(Backup.id == backup_id)
+    if request.target_host_id:
+        stmt = stmt.add_columns(
+            exists().where(KVMHost.id == request.target_host_id).label("kvm_host_exists"),
+            exists().where(PodmanHost.id == request.target_host_id).label("podman_host_exists")
+        )
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backup not found"
         )
 
-    if backup.status != BackupStatus.COMPLETED:
+    if row.status != BackupStatus.COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot restore backup with status: {backup.status}. Only completed backups can be restored."
+            detail=f"Cannot restore backup with status: {row.status}. Only completed backups can be restored."
         )
 
     # Validate target host if specified
     if request.target_host_id:
-        if backup.source_type == SourceType.VM:
-            from backend.models.infrastructure import KVMHost
-            target_host = await db.get(KVMHost, request.target_host_id)
-            if not target_host:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"KVM host with ID {request.target_host_id} not found"
-                )
-        elif backup.source_type == SourceType.CONTAINER:
-            from backend.models.infrastructure import PodmanHost
-            target_host = await db.get(PodmanHost, request.target_host_id)
-            if not target_host:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Podman host with ID {request.target_host_id} not found"
-                )
-
-    # Queue restore job via Celery
-    from backend.worker import execute_restore
-    task = execute_restore.delay(
-        backup_id,
-        request.target_host_id,
-        request.new_name,
-        request.overwrite,
-        request.storage_type,
-        request.storage_config
-    )
+        if row.source_type == SourceType.VM and not row.kvm_host_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"KVM host with ID {request.target_host_id} not found"
+            )
+        elif row.source_type == SourceType.CONTAINER and not row.podman_host_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Podman host with ID {request.target_host_id} not found"
+            )
 
-    # Create job record
-    from backend.models.backup import Job, JobType, JobStatus
+    # Create job record with a pre-assigned task ID, committed before the
+    # worker looks it up
+    task_id = str(uuid4())
     job = Job(
         type=JobType.RESTORE,
         status=JobStatus.PENDING,
         backup_id=backup_id,
-        celery_task_id=task.id,
+        celery_task_id=task_id,
         job_metadata={
             "target_host_id": request.target_host_id,
             "new_name": request.new_name,
@@ -440,13 +624,35 @@ async def restore_backup(
     )
     db.add(job)
     await db.commit()
-    await db.refresh(job)
+
+    # Queue restore job via Celery
+    try:
+        await _enqueue(
+            execute_restore,
+            (
+                backup_id,
+                request.target_host_id,
+                request.new_name,
+                request.overwrite,
+                request.storage_type,
+                request.storage_config
+            ),
+            task_id=task_id
+        )
+    except Exception as e:
+        job.status = JobStatus.FAILED
+        job.error_message = f"Failed to queue restore: {e}"
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to queue restore job"
+        )
 
     return {
         "message": "Restore job queued successfully",
         "job_id": job.id,
         "backup_id": backup_id,
-        "task_id": task.id
+        "task_id": task_id
     }
 
 
@@ -474,22 +680,22 @@ async def verify_backup_endpoint(
     Returns:
         Job details including job_id and task_id for tracking
     """
-    backup = await db.get(Backup, backup_id)
-    if not backup:
+    # Only the status is needed; avoid loading the whole row
+    backup_status = await db.scalar(select(Backup.status).where(Backup.id == backup_id))
+    if backup_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backup not found"
         )
 
-    if backup.status != BackupStatus.COMPLETED:
+    if backup_status != BackupStatus.COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot verify backup with status: {backup.status}. Only completed backups can be verified."
+            detail=f"Cannot verify backup with status: {backup_status}. Only completed backups can be verified."
         )
 
     # Queue verification job via Celery
-    from backend.worker import verify_backup
-    task = verify_backup.delay(backup_id)
+    task = await _enqueue(verify_backup, (backup_id,))
 
     # Job will be created by the worker task itself
     # Return immediately with task info
@@ -533,9 +739,6 @@ async def make_backup_immutable(
 
     Related: Issue #13 - Immutable Backup Support
     """
-    from backend.services.immutability import ImmutabilityService, ImmutabilityError
-    from backend.models.backup import RetentionMode
-
     backup = await db.get(Backup, backup_id)
     if not backup:
         raise HTTPException(
@@ -564,6 +767,7 @@ async def make_backup_immutable(
         )
         await db.commit()
         await db.refresh(backup)
+        await _backup_cache.invalidate(backup_id)
 
         return {
             "message": f"Backup {backup_id} marked as immutable",
@@ -594,8 +798,6 @@ async def remove_legal_hold(
 
     Related: Issue #13 - Immutable Backup Support
     """
-    from backend.services.immutability import ImmutabilityService, ImmutabilityError
-
     backup = await db.get(Backup, backup_id)
     if not backup:
         raise HTTPException(
@@ -609,6 +811,7 @@ async def remove_legal_hold(
         await immutability_service.remove_legal_hold(backup_id)
         await db.commit()
         await db.refresh(backup)
+        await _backup_cache.invalidate(backup_id)
 
         return {
             "message": f"Legal hold removed from backup {backup_id}",
@@ -636,8 +839,6 @@ async def get_immutability_statistics(
 
     Related: Issue #13 - Immutable Backup Support
     """
-    from backend.services.immutability import ImmutabilityService
-
     immutability_service = ImmutabilityService(db)
     stats = await immutability_service.get_retention_statistics()
 
@@ -648,7 +849,7 @@ async def get_immutability_statistics(
 # Backup Chain Management Endpoints (Issue #10)
 # ============================================================================
 
-@router.get("/chains/{chain_id}")
+@router.get("/chains/{chain_id}", response_class=StreamingResponse)
 async def get_backup_chain(
     chain_id: str,
     db: AsyncSession = Depends(get_db),
@@ -661,23 +862,44 @@ async def get_backup_chain(
     - Full backup (sequence 0)
     - All incremental backups in order
     - Deduplication and compression metrics
-    """
-    from backend.services.backup_chain import BackupChainService
 
-    chain_service = BackupChainService(db)
-    backups = await chain_service.get_backup_chain(chain_id)
+    Backups are streamed in batches, so long incremental chains are never
+    held in memory all at once.
+    """
+    conditions = BackupChainService.chain_conditions(chain_id)
+    backup_count = await db.scalar(select(func.count()).select_from(Backup).where(*conditions))
 
-    if not backups:
+    if not backup_count:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chain {chain_id} not found"
         )
 
-    return {
-        "chain_id": chain_id,
-        "backup_count": len(backups),
-        "backups": [BackupResponse.from_orm(b) for b in backups]
-    }
+    stmt = select(*BACKUP_LIST_COLUMNS).where(*conditions).order_by(Backup.sequence_number)
+
+    async def generate_chain():
+        # The request session is closed before a streamed body is sent,
+        # so rows are read through a dedicated session.
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                stmt,
+                execution_options={"stream_results": True, "yield_per": BACKUP_LIST_BATCH_SIZE}
+            )
+
+            yield (
+                b'{"chain_id":' + orjson.dumps(chain_id)
+                + f',"backup_count":{backup_count},"backups":['.encode()
+            )
+            first = True
+            async for partition in result.partitions():
+                items = BACKUP_LIST_ADAPTER.validate_python(partition, from_attributes=True)
+                # Strip the enclosing brackets so batches join into one array
+                chunk = BACKUP_LIST_ADAPTER.dump_json(items)[1:-1]
+                yield chunk if first else b"," + chunk
+                first = False
+            yield b"]}"
+
+    return StreamingResponse(generate_chain(), media_type="application/json")
 
 
 @router.get("/chains/{chain_id}/statistics")
@@ -694,8 +916,6 @@ async def get_chain_statistics(
     - Average deduplication and compression ratios
     - Per-backup details with sequence information
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     stats = await chain_service.get_chain_statistics(chain_id)
 
@@ -720,15 +940,19 @@ async def get_orphaned_backups(
     references a non-existent backup. These should be investigated
     and potentially cleaned up.
     """
-    from backend.services.backup_chain import BackupChainService
+    # Select only the response columns, as for the backup listing
+    stmt = BackupChainService.orphaned_backups_query(*BACKUP_LIST_COLUMNS)
+    rows = (await db.execute(stmt)).all()
 
-    chain_service = BackupChainService(db)
-    orphaned = await chain_service.find_orphaned_backups()
+    if rows:
+        logger.warning(f"Found {len(rows)} orphaned backups")
 
-    return {
+    # Returned as a response so FastAPI skips jsonable_encoder
+    orphaned = BACKUP_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return ORJSONResponse({
         "orphaned_count": len(orphaned),
-        "backups": [BackupResponse.from_orm(b) for b in orphaned]
-    }
+        "backups": BACKUP_LIST_ADAPTER.dump_python(orphaned, mode="json")
+    })
 
 
 @router.get("/statistics/global")
@@ -746,8 +970,6 @@ async def get_global_backup_statistics(
     - Average efficiency ratios
     - Overall storage efficiency percentage
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     stats = await chain_service.get_global_statistics()
 
@@ -768,8 +990,6 @@ async def check_backup_deletion(
 
     This is a read-only check - it does not delete anything.
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     can_delete, reason = await chain_service.can_delete_backup(backup_id)
 
@@ -798,8 +1018,6 @@ async def get_restoration_plan(
 
     Related: Issue #15 - Implement Changed Block Tracking (CBT)
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     plan = await chain_service.get_restoration_plan(backup_id)
 
@@ -830,8 +1048,6 @@ async def verify_chain_integrity(
 
     Related: Issue #15 - Implement Changed Block Tracking (CBT)
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     result = await chain_service.verify_chain_integrity(chain_id)
 
@@ -862,8 +1078,6 @@ async def get_chains_needing_consolidation(
 
     Related: Issue #15 - Implement Changed Block Tracking (CBT)
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     chains = await chain_service.get_chains_needing_consolidation(max_chain_length)
 
@@ -895,8 +1109,6 @@ async def consolidate_chain(
 
     Related: Issue #15 - Implement Changed Block Tracking (CBT)
     """
-    from backend.services.backup_chain import BackupChainService
-
     chain_service = BackupChainService(db)
     result = await chain_service.consolidate_chain(chain_id, target_backup_id)
 
@@ -7,10 +7,12 @@ viewing compliance dashboard, and triggering compliance calculations.
 Related: Issue #8 - Build Compliance Tracking System
 """
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from sqlalchemy import select, literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Dict, Any
 
 from backend.models.base import get_db
@@ -18,7 +20,7 @@ from backend.models.user import User, UserRole
 from backend.models.infrastructure import VM, Container
 from backend.models.backup import SourceType
 from backend.core.security import get_current_user, require_role
-from backend.services.compliance import ComplianceService
+from backend.services.compliance import ComplianceService, compliance_dashboard_cache
 from backend.worker import calculate_compliance
 
 router = APIRouter()
@@ -38,6 +40,29 @@ class ComplianceStatusResponse(BaseModel):
         from_attributes = True
 
 
+# Validates a page of compliance rows in one pydantic-core call
+COMPLIANCE_LIST_ADAPTER = TypeAdapter(List[ComplianceStatusResponse])
+
+
+def _compliance_columns(model, source_type: str) -> tuple:
+    """Columns matching ComplianceStatusResponse for VM or Container rows."""
+    return (
+        model.id,
+        model.name,
+        literal(source_type).label("source_type"),
+        model.compliance_status,
+        model.compliance_reason,
+        model.last_successful_backup,
+        model.compliance_last_checked,
+    )
+
+
+class ComplianceStatusPage(BaseModel):
+    """Page of compliance statuses, ordered by ID."""
+    items: List[ComplianceStatusResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to fetch the next page; null on the last page")
+
+
 class ComplianceDashboardResponse(BaseModel):
     """Compliance dashboard overview."""
     vms: Dict[str, int] = Field(..., description="VM compliance breakdown (total, grey, green, yellow, red)")
@@ -66,7 +91,7 @@ class ComplianceCalculationResponse(BaseModel):
     message: str
 
 
-@router.get("/dashboard", response_model=ComplianceDashboardResponse)
+@router.get("/dashboard", response_class=Response, responses={200: {"model": ComplianceDashboardResponse}})
 async def get_compliance_dashboard(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -81,9 +106,14 @@ async def get_compliance_dashboard(
 
     **Permissions**: All authenticated users
     """
-    compliance_service = ComplianceService(db)
-    dashboard = await compliance_service.get_compliance_dashboard()
-    return dashboard
+    body = await compliance_dashboard_cache.get("global")
+    if body is None:
+        compliance_service = ComplianceService(db)
+        dashboard = await compliance_service.get_compliance_dashboard()
+        body = orjson.dumps(dashboard)
+        await compliance_dashboard_cache.set("global", body)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/non-compliant", response_model=NonCompliantResponse)
@@ -103,9 +133,11 @@ async def get_non_compliant(
     return non_compliant
 
 
-@router.get("/vms", response_model=List[ComplianceStatusResponse])
+@router.get("/vms", response_model=ComplianceStatusPage)
 async def get_vm_compliance(
     status_filter: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -114,10 +146,14 @@ async def get_vm_compliance(
 
     **Query Parameters**:
     - `status_filter` (optional): Filter by status (GREY, GREEN, YELLOW, RED)
+    - `limit` (optional): Page size (default 100, max 500)
+    - `after_id` (optional): `next_cursor` of the previous page
 
     **Permissions**: All authenticated users
     """
-    stmt = select(VM)
+    stmt = select(*_compliance_columns(VM, "vm")).order_by(VM.id).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(VM.id > after_id)
 
     if status_filter:
         status_upper = status_filter.upper()
@@ -129,25 +165,18 @@ async def get_vm_compliance(
         stmt = stmt.where(VM.compliance_status == status_upper)
 
     result = await db.execute(stmt)
-    vms = result.scalars().all()
-
-    return [
-        ComplianceStatusResponse(
-            id=vm.id,
-            name=vm.name,
-            source_type="vm",
-            compliance_status=vm.compliance_status,
-            compliance_reason=vm.compliance_reason,
-            last_successful_backup=vm.last_successful_backup,
-            compliance_last_checked=vm.compliance_last_checked
-        )
-        for vm in vms
-    ]
+    rows = result.all()
 
+    items = COMPLIANCE_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    next_cursor = rows[-1].id if len(rows) == limit else None
+    return ComplianceStatusPage(items=items, next_cursor=next_cursor)
 
-@router.get("/containers", response_model=List[ComplianceStatusResponse])
+
+@router.get("/containers", response_model=ComplianceStatusPage)
 async def get_container_compliance(
     status_filter: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -156,10 +185,14 @@ async def get_container_compliance(
 
     **Query Parameters**:
     - `status_filter` (optional): Filter by status (GREY, GREEN, YELLOW, RED)
+    - `limit` (optional): Page size (default 100, max 500)
+    - `after_id` (optional): `next_cursor` of the previous page
 
     **Permissions**: All authenticated users
     """
-    stmt = select(Container)
+    stmt = select(*_compliance_columns(Container, "container")).order_by(Container.id).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(Container.id > after_id)
 
     if status_filter:
         status_upper = status_filter.upper()
@@ -171,20 +204,11 @@ async def get_container_compliance(
         stmt = stmt.where(Container.compliance_status == status_upper)
 
     result = await db.execute(stmt)
-    containers = result.scalars().all()
-
-    return [
-        ComplianceStatusResponse(
-            id=container.id,
-            name=container.name,
-            source_type="container",
-            compliance_status=container.compliance_status,
-            compliance_reason=container.compliance_reason,
-            last_successful_backup=container.last_successful_backup,
-            compliance_last_checked=container.compliance_last_checked
-        )
-        for container in containers
-    ]
+    rows = result.all()
+
+    items = COMPLIANCE_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    next_cursor = rows[-1].id if len(rows) == limit else None
+    return ComplianceStatusPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/vms/{vm_id}", response_model=ComplianceStatusResponse)
@@ -4,7 +4,9 @@ Dashboard API endpoints.
 Provides statistics and overview data for the main dashboard.
 Related: Issue #16 - React Frontend
 """
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
@@ -12,11 +14,16 @@ from pydantic import BaseModel
 from backend.models.base import get_db
 from backend.models.backup import Backup, Job, BackupSchedule, BackupStatus, JobStatus
 from backend.models.infrastructure import VM, Container
+from backend.core.cache import ResponseCache
+from backend.core.config import settings
 from backend.core.security import get_current_user
 from backend.models.user import User
 
 router = APIRouter()
 
+# Serialized global statistics; the dashboard polls this endpoint
+_stats_cache = ResponseCache("dashboard_stats", ttl=settings.STATS_CACHE_TTL, maxsize=1)
+
 
 class DashboardStats(BaseModel):
     """Dashboard statistics model."""
@@ -30,7 +37,7 @@ class DashboardStats(BaseModel):
     active_schedules: int
 
 
-@router.get("/stats", response_model=DashboardStats)
+@router.get("/stats", response_class=Response, responses={200: {"model": DashboardStats}})
 async def get_dashboard_stats(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -39,56 +46,40 @@ async def get_dashboard_stats(
     Get dashboard statistics.
 
     Returns counts and metrics for backups, VMs, containers, jobs, and schedules.
+    Statistics are global and cached for STATS_CACHE_TTL seconds.
     """
-    # Count total backups
-    stmt = select(func.count(Backup.id))
-    result = await db.execute(stmt)
-    total_backups = result.scalar_one() or 0
-
-    # Count successful backups
-    stmt = select(func.count(Backup.id)).where(Backup.status == BackupStatus.COMPLETED)
-    result = await db.execute(stmt)
-    successful_backups = result.scalar_one() or 0
-
-    # Count failed backups
-    stmt = select(func.count(Backup.id)).where(Backup.status == BackupStatus.FAILED)
-    result = await db.execute(stmt)
-    failed_backups = result.scalar_one() or 0
-
-    # Sum total backup size
-    stmt = select(func.coalesce(func.sum(Backup.size), 0))
-    result = await db.execute(stmt)
-    total_size_bytes = result.scalar_one() or 0
-
-    # Count active jobs (PENDING or RUNNING)
-    stmt = select(func.count(Job.id)).where(
-        Job.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+    headers = {"Cache-Control": f"private, max-age={settings.STATS_CACHE_TTL}"}
+
+    body = await _stats_cache.get("global")
+    if body is None:
+        body = await _compute_dashboard_stats(db)
+        await _stats_cache.set("global", body)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _compute_dashboard_stats(db: AsyncSession) -> bytes:
+    """Compute dashboard statistics and return them serialized."""
+    # All counts are gathered in one round-trip: backup figures in a single
+    # pass over backups, the rest as scalar subqueries
+    backup_stats = select(
+        func.count(Backup.id).label("total_backups"),
+        func.count(Backup.id).filter(Backup.status == BackupStatus.COMPLETED).label("successful_backups"),
+        func.count(Backup.id).filter(Backup.status == BackupStatus.FAILED).label("failed_backups"),
+        func.coalesce(func.sum(Backup.size), 0).label("total_size_bytes")
+    ).subquery()
+
+    stmt = select(
+        backup_stats,
+        select(func.count(Job.id)).where(
+            Job.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+        ).scalar_subquery().label("active_jobs"),
+        select(func.count(VM.id)).scalar_subquery().label("total_vms"),
+        select(func.count(Container.id)).scalar_subquery().label("total_containers"),
+        select(func.count(BackupSchedule.id)).where(
+            BackupSchedule.enabled == True
+        ).scalar_subquery().label("active_schedules")
     )
     result = await db.execute(stmt)
-    active_jobs = result.scalar_one() or 0
-
-    # Count total VMs
-    stmt = select(func.count(VM.id))
-    result = await db.execute(stmt)
-    total_vms = result.scalar_one() or 0
-
-    # Count total containers
-    stmt = select(func.count(Container.id))
-    result = await db.execute(stmt)
-    total_containers = result.scalar_one() or 0
-
-    # Count active schedules
-    stmt = select(func.count(BackupSchedule.id)).where(BackupSchedule.enabled == True)
-    result = await db.execute(stmt)
-    active_schedules = result.scalar_one() or 0
 
-    return DashboardStats(
-        total_backups=total_backups,
-        successful_backups=successful_backups,
-        failed_backups=failed_backups,
-        total_size_bytes=total_size_bytes,
-        active_jobs=active_jobs,
-        total_vms=total_vms,
-        total_containers=total_containers,
-        active_schedules=active_schedules
-    )
+    return orjson.dumps(DashboardStats(**result.one()._mapping).model_dump())
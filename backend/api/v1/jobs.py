@@ -3,9 +3,9 @@ Job API endpoints.
 """
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict, Any
 
 from backend.models.base import get_db
@@ -46,6 +46,24 @@ class JobResponse(BaseModel):
         )
 
 
+# Validates a page of job rows in one pydantic-core call
+JOB_LIST_ADAPTER = TypeAdapter(List[JobResponse])
+
+# Columns matching JobResponse (Job.metadata is the SQLAlchemy MetaData,
+# so the JSON column is selected under the response's field name)
+JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.type,
+    Job.status,
+    Job.backup_id,
+    Job.started_at,
+    Job.completed_at,
+    Job.error_message,
+    Job.job_metadata.label("metadata"),
+    Job.created_at,
+)
+
+
 class JobLogResponse(BaseModel):
     id: int
     timestamp: datetime
@@ -95,24 +113,28 @@ async def list_jobs(
     if end_date:
         conditions.append(Job.created_at <= end_date)
 
-    # Get total count
-    count_stmt = select(func.count(Job.id))
-    if conditions:
-        count_stmt = count_stmt.where(and_(*conditions))
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
-
-    # Get paginated results
-    stmt = select(Job)
+    # Get paginated results with the total count as a window aggregate, so
+    # the filter is evaluated once in a single round-trip
+    stmt = select(*JOB_LIST_COLUMNS, func.count().over().label("total"))
     if conditions:
         stmt = stmt.where(and_(*conditions))
     stmt = stmt.order_by(Job.created_at.desc()).limit(limit).offset(offset)
 
     result = await db.execute(stmt)
-    jobs = result.scalars().all()
-
-    # Convert ORM objects to response models
-    job_responses = [JobResponse.from_orm_job(job) for job in jobs]
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Past the last page: no row carries the total
+        count_stmt = select(func.count(Job.id))
+        if conditions:
+            count_stmt = count_stmt.where(and_(*conditions))
+        total = await db.scalar(count_stmt)
+    else:
+        total = 0
+
+    job_responses = JOB_LIST_ADAPTER.validate_python(rows, from_attributes=True)
     return JobsListResponse(jobs=job_responses, total=total, limit=limit, offset=offset)
 
 
@@ -145,16 +167,18 @@ async def get_job_logs(
     if current_user.role not in [UserRole.ADMIN, UserRole.OPERATOR]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    job = await db.get(Job, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
     stmt = select(JobLog).where(JobLog.job_id == job_id)
     if level:
         stmt = stmt.where(JobLog.level == level.upper())
     stmt = stmt.order_by(JobLog.timestamp)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    logs = result.scalars().all()
+
+    # Only an empty result needs the job's existence checked
+    if not logs and await db.scalar(select(Job.id).where(Job.id == job_id)) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return logs
 
 
 @router.post("/{job_id}/cancel")
@@ -168,24 +192,34 @@ async def cancel_job(
     if current_user.role not in [UserRole.ADMIN, UserRole.OPERATOR]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    job = await db.get(Job, job_id)
-    if not job:
+    # TODO: Actually cancel the Celery task if running
+    # For now, just mark as cancelled. The row lock serializes concurrent
+    # cancels, so the status read here is the one being replaced.
+    previous_status = await db.scalar(
+        select(Job.status).where(Job.id == job_id).with_for_update()
+    )
+    if previous_status is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.status not in [JobStatus.PENDING, JobStatus.RUNNING]:
-        raise HTTPException(status_code=400, detail=f"Cannot cancel job with status {job.status}")
+    if previous_status not in [JobStatus.PENDING, JobStatus.RUNNING]:
+        raise HTTPException(status_code=400, detail=f"Cannot cancel job with status {previous_status}")
 
-    # TODO: Actually cancel the Celery task if running
-    # For now, just mark as cancelled
-    job.status = JobStatus.CANCELLED
-    job.completed_at = datetime.utcnow()
+    await db.execute(
+        update(Job)
+        .where(
+            Job.id == job_id,
+            Job.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+        )
+        .values(status=JobStatus.CANCELLED, completed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
 
     # Add cancellation log
     cancel_log = JobLog(
         job_id=job_id,
         level="WARNING",
         message=f"Job cancelled by user {current_user.username}",
-        details={"cancelled_by": current_user.username, "previous_status": job.status.value}
+        details={"cancelled_by": current_user.username, "previous_status": previous_status.value}
     )
     db.add(cancel_log)
 
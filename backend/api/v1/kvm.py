@@ -7,6 +7,7 @@ import tempfile
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List, Optional, Generic, TypeVar
@@ -507,6 +508,48 @@ async def list_all_vms(
     return PaginatedResponse(items=items, total=total, limit=limit, offset=offset)
 
 
+async def _upsert_vms(db: AsyncSession, host_id: int, vms_data: List[dict]) -> int:
+    """
+    Insert VMs reported by libvirt, updating existing ones matched by UUID.
+
+    All VMs are written with a single INSERT ... ON CONFLICT statement
+    instead of a lookup and write per VM.
+
+    Args:
+        db: Database session
+        host_id: KVM host the VMs were listed from (used for new VMs)
+        vms_data: VM dicts from KVMBackupService.list_vms
+
+    Returns:
+        Number of VMs synced
+    """
+    if not vms_data:
+        return 0
+
+    stmt = pg_insert(VM).values([
+        {
+            "kvm_host_id": host_id,
+            "name": vm_data["name"],
+            "uuid": vm_data["uuid"],
+            "vcpus": vm_data["vcpus"],
+            "memory": vm_data["memory"],
+            "state": vm_data["state"],
+        }
+        for vm_data in vms_data
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VM.uuid],
+        set_={
+            "name": stmt.excluded.name,
+            "state": stmt.excluded.state,
+            "vcpus": stmt.excluded.vcpus,
+            "memory": stmt.excluded.memory,
+        }
+    )
+    await db.execute(stmt)
+    return len(vms_data)
+
+
 @router.get("/hosts/{host_id}/vms", response_model=List[VMResponse])
 async def list_vms(
     host_id: int,
@@ -537,29 +580,7 @@ async def list_vms(
         vms_data = await kvm_service.list_vms(host.uri)
 
         # Update database
-        for vm_data in vms_data:
-            stmt = select(VM).where(VM.uuid == vm_data["uuid"])
-            result = await db.execute(stmt)
-            vm = result.scalar_one_or_none()
-
-            if vm:
-                # Update existing
-                vm.name = vm_data["name"]
-                vm.state = vm_data["state"]
-                vm.vcpus = vm_data["vcpus"]
-                vm.memory = vm_data["memory"]
-            else:
-                # Create new
-                vm = VM(
-                    kvm_host_id=host.id,
-                    name=vm_data["name"],
-                    uuid=vm_data["uuid"],
-                    vcpus=vm_data["vcpus"],
-                    memory=vm_data["memory"],
-                    state=vm_data["state"]
-                )
-                db.add(vm)
-
+        await _upsert_vms(db, host.id, vms_data)
         await db.commit()
 
     # Return VMs from database
@@ -603,31 +624,7 @@ async def refresh_host(
         )
 
     # Update database
-    synced_count = 0
-    for vm_data in vms_data:
-        stmt = select(VM).where(VM.uuid == vm_data["uuid"])
-        result = await db.execute(stmt)
-        vm = result.scalar_one_or_none()
-
-        if vm:
-            # Update existing
-            vm.name = vm_data["name"]
-            vm.state = vm_data["state"]
-            vm.vcpus = vm_data["vcpus"]
-            vm.memory = vm_data["memory"]
-        else:
-            # Create new
-            vm = VM(
-                kvm_host_id=host.id,
-                name=vm_data["name"],
-                uuid=vm_data["uuid"],
-                vcpus=vm_data["vcpus"],
-                memory=vm_data["memory"],
-                state=vm_data["state"]
-            )
-            db.add(vm)
-        synced_count += 1
-
+    synced_count = await _upsert_vms(db, host.id, vms_data)
     await db.commit()
 
     return {
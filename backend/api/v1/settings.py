@@ -2,7 +2,7 @@
 System settings API endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional, Dict, Any
@@ -11,6 +11,7 @@ from backend.models.base import get_db
 from backend.models.user import User, UserRole
 from backend.models.settings import SystemSetting
 from backend.core.security import get_current_user, require_role
+from backend.services.settings import invalidate_system_settings
 
 router = APIRouter()
 
@@ -138,6 +139,7 @@ async def update_setting(
     setting.value = SystemSetting.set_value(value)
     await db.commit()
     await db.refresh(setting)
+    invalidate_system_settings(key)
 
     return setting
 
@@ -172,6 +174,7 @@ async def create_setting(
     db.add(setting)
     await db.commit()
     await db.refresh(setting)
+    invalidate_system_settings(setting.key)
 
     return setting
 
@@ -195,6 +198,7 @@ async def bulk_update_settings(
             updated.append(key)
 
     await db.commit()
+    invalidate_system_settings()
 
     return {
         "message": f"Updated {len(updated)} settings",
@@ -205,16 +209,14 @@ async def bulk_update_settings(
 @router.get("/setup/status")
 async def setup_status(db: AsyncSession = Depends(get_db)):
     """Check if initial setup is complete."""
-    # Check if admin user exists
+    # Check if an admin user and any settings exist (one round-trip)
     from backend.models.user import User
-    stmt = select(User).where(User.role == UserRole.ADMIN)
-    result = await db.execute(stmt)
-    admin_exists = result.scalar_one_or_none() is not None
-
-    # Check if any settings exist
-    stmt = select(SystemSetting).limit(1)
+    stmt = select(
+        exists().where(User.role == UserRole.ADMIN),
+        exists().select_from(SystemSetting)
+    )
     result = await db.execute(stmt)
-    settings_exist = result.scalar_one_or_none() is not None
+    admin_exists, settings_exist = result.one()
 
     return {
         "setup_complete": admin_exists and settings_exist,
@@ -231,20 +233,20 @@ async def initialize_setup(
     """Initialize system with setup wizard data."""
     # Check if setup is already complete
     from backend.models.user import User
-    stmt = select(User).where(User.role == UserRole.ADMIN)
+    stmt = select(exists().where(User.role == UserRole.ADMIN))
     result = await db.execute(stmt)
-    if result.scalar_one_or_none():
+    if result.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="System is already initialized"
         )
 
     # Create admin user
-    from backend.core.security import get_password_hash
+    from backend.core.security import get_password_hash_async
     admin = User(
         username=setup_data.admin_username,
         email=setup_data.admin_email,
-        password_hash=get_password_hash(setup_data.admin_password),
+        password_hash=await get_password_hash_async(setup_data.admin_password),
         role=UserRole.ADMIN,
         is_active=True
     )
@@ -305,6 +307,7 @@ async def initialize_setup(
         db.add(setting)
 
     await db.commit()
+    invalidate_system_settings()
 
     return {
         "message": "System initialized successfully",
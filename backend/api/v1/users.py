@@ -4,9 +4,9 @@ User Management API endpoints.
 import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy import select
+from sqlalchemy import select, or_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import List, Optional
 
 from backend.models.base import get_db
@@ -14,8 +14,7 @@ from backend.models.user import User, UserRole
 from backend.core.security import (
     get_current_user,
     require_role,
-    get_password_hash,
-    verify_password
+    get_password_hash_async
 )
 from backend.services.audit_logger import AuditLogger
 
@@ -50,8 +49,7 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 @router.get("", response_model=List[UserResponse], dependencies=[Depends(require_role(UserRole.ADMIN))])
@@ -81,19 +79,18 @@ async def create_user(
     audit_logger = AuditLogger(db)
     ip_address = request.client.host if request.client else "unknown"
 
-    # Check if username exists
-    stmt = select(User).where(User.username == user_data.username)
+    # Check if username or email exists (one round-trip)
+    stmt = select(User.username, User.email).where(
+        or_(User.username == user_data.username, User.email == user_data.email)
+    )
     result = await db.execute(stmt)
-    if result.scalar_one_or_none():
+    existing = result.all()
+    if any(row.username == user_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists"
         )
-
-    # Check if email exists
-    stmt = select(User).where(User.email == user_data.email)
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
@@ -103,7 +100,7 @@ async def create_user(
     user = User(
         username=user_data.username,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash_async(user_data.password),
         role=user_data.role,
         is_active=user_data.is_active
     )
@@ -140,8 +137,7 @@ async def get_user(
     Get user by ID (admin only).
     """
     stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(stmt)
 
     if not user:
         raise HTTPException(
@@ -168,8 +164,7 @@ async def update_user(
 
     # Get user
     stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(stmt)
 
     if not user:
         raise HTTPException(
@@ -198,9 +193,9 @@ async def update_user(
     # Update fields
     if user_data.email is not None:
         # Check if email is already taken by another user
-        stmt = select(User).where(User.email == user_data.email, User.id != user_id)
+        stmt = select(exists().where(User.email == user_data.email, User.id != user_id))
         result = await db.execute(stmt)
-        if result.scalar_one_or_none():
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already exists"
@@ -208,7 +203,7 @@ async def update_user(
         user.email = user_data.email
 
     if user_data.password is not None and user_data.password.strip():
-        user.password_hash = get_password_hash(user_data.password)
+        user.password_hash = await get_password_hash_async(user_data.password)
 
     if user_data.role is not None:
         user.role = user_data.role
@@ -269,8 +264,7 @@ async def delete_user(
 
     # Get user
     stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(stmt)
 
     if not user:
         raise HTTPException(
@@ -0,0 +1,151 @@
+"""
+Short-lived response caching.
+
+Provides a small in-process TTL cache backed by Redis so repeated
+dashboard/statistics requests can be answered without recomputing
+aggregates. Redis is shared across API workers; the in-process layer
+avoids a network hop for hot keys. Redis failures are logged and
+ignored - the cache simply degrades to per-process.
+"""
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Async Redis clients keyed by the event loop they were created on
+_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_MISSING = object()
+
+
+def get_redis():
+    """
+    Get the async Redis client for the running event loop (created lazily).
+
+    Connections belong to the event loop that opened them. Celery tasks run
+    each invocation in a new loop, so a client is kept per loop; code that
+    runs short-lived loops must call close_redis() before the loop ends.
+    """
+    loop = asyncio.get_running_loop()
+    client = _redis_clients.get(loop)
+    if client is None:
+        import redis.asyncio as aioredis
+        client = aioredis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+        _redis_clients[loop] = client
+    return client
+
+
+async def close_redis() -> None:
+    """Close the running loop's Redis client and its connection pool, if any."""
+    client = _redis_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class TTLCache:
+    """Bounded in-process cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries (least recently used are evicted)
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value, or ``default`` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class ResponseCache:
+    """Two-level (process + Redis) cache for serialized response bodies."""
+
+    def __init__(self, namespace: str, ttl: int = 30, maxsize: int = 128):
+        """
+        Initialize response cache.
+
+        Args:
+            namespace: Redis key prefix for this cache
+            ttl: Entry lifetime in seconds
+            maxsize: Maximum in-process entries
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _redis_key(self, key: Hashable) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    async def get(self, key: Hashable) -> Optional[bytes]:
+        """Return cached bytes for ``key`` or None."""
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            value = await get_redis().get(self._redis_key(key))
+        except Exception as e:
+            logger.debug(f"Redis cache get failed for {self.namespace}: {e}")
+            return None
+
+        if value is not None:
+            self._local.set(key, value)
+        return value
+
+    async def set(self, key: Hashable, value: bytes) -> None:
+        """Cache ``value`` for ``key`` in both levels."""
+        self._local.set(key, value)
+        try:
+            await get_redis().set(self._redis_key(key), value, ex=self.ttl)
+        except Exception as e:
+            logger.debug(f"Redis cache set failed for {self.namespace}: {e}")
+
+    async def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from both levels."""
+        self._local.pop(key)
+        try:
+            await get_redis().delete(self._redis_key(key))
+        except Exception as e:
+            logger.debug(f"Redis cache delete failed for {self.namespace}: {e}")
@@ -32,6 +32,9 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    LOGIN_RATE_LIMIT_PER_MINUTE: int = 10  # per client IP
+    LOGIN_MAX_FAILURES: int = 5  # per username before lockout backoff
+    LOGIN_FAILURE_WINDOW_SECONDS: int = 900
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -41,16 +44,25 @@ class Settings(BaseSettings):
     DB_ECHO: bool = False
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 10  # Seconds a request waits for a free connection before failing
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    DB_POOL_WARMUP: bool = True  # Open DB_POOL_SIZE connections at API startup
+    DB_JIT: bool = False  # PostgreSQL JIT; compile cost outweighs gains for short API queries
+    DB_WARN_LAZY_LOADS: bool = False  # Log ORM lazy loads (always on with DEBUG)
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 300
+    STATS_CACHE_TTL: int = 30  # seconds; dashboard/statistics responses
 
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
     CELERY_TASK_TRACK_STARTED: bool = True
     CELERY_TASK_TIME_LIMIT: int = 7200  # 2 hours
+    CELERY_WORKER_CONCURRENCY: Optional[int] = None  # Worker processes; defaults to CPU count
+    CELERY_WORKER_PREFETCH_MULTIPLIER: int = 1  # Long tasks: reserve one at a time so bursts spread across workers
 
     # Storage
     BACKUP_BASE_PATH: str = "/backups"
@@ -0,0 +1,110 @@
+"""
+Login rate limiting.
+
+Rejects excess login attempts before the password hash is checked, so
+password guessing cannot pin the CPU on the KDF. Counters live in Redis
+so limits are shared by all API workers:
+
+- At most LOGIN_RATE_LIMIT_PER_MINUTE attempts per client IP per minute.
+- After LOGIN_MAX_FAILURES failed attempts for a username within
+  LOGIN_FAILURE_WINDOW_SECONDS, further attempts are locked out for a
+  period that doubles with each additional failure.
+
+If Redis is unavailable the limiter fails open.
+"""
+import logging
+from fastapi import HTTPException, status
+
+from backend.core.cache import get_redis
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Initial lockout once the failure threshold is reached
+LOCKOUT_BASE_SECONDS = 30
+
+
+def _ip_key(ip_address: str) -> str:
+    return f"ratelimit:login:ip:{ip_address}"
+
+
+def _failures_key(username: str) -> str:
+    return f"ratelimit:login:failures:{username.lower()}"
+
+
+def _lockout_key(username: str) -> str:
+    return f"ratelimit:login:lockout:{username.lower()}"
+
+
+def _too_many_attempts(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts. Try again later.",
+        headers={"Retry-After": str(max(retry_after, 1))},
+    )
+
+
+async def enforce_login_rate_limit(ip_address: str, username: str) -> None:
+    """
+    Reject a login attempt if the client IP or username is rate limited.
+
+    Args:
+        ip_address: Client IP address
+        username: Submitted username
+
+    Raises:
+        HTTPException: 429 if the attempt is over the limit
+    """
+    redis = get_redis()
+    try:
+        lockout_ttl = await redis.ttl(_lockout_key(username))
+        if lockout_ttl > 0:
+            raise _too_many_attempts(lockout_ttl)
+
+        ip_key = _ip_key(ip_address)
+        attempts = await redis.incr(ip_key)
+        if attempts == 1:
+            await redis.expire(ip_key, 60)
+        if attempts > settings.LOGIN_RATE_LIMIT_PER_MINUTE:
+            raise _too_many_attempts(await redis.ttl(ip_key))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.debug(f"Login rate limit check skipped: {e}")
+
+
+async def record_login_failure(username: str) -> None:
+    """
+    Count a failed login and lock the username out if over the threshold.
+
+    Args:
+        username: Submitted username
+    """
+    redis = get_redis()
+    try:
+        failures_key = _failures_key(username)
+        failures = await redis.incr(failures_key)
+        await redis.expire(failures_key, settings.LOGIN_FAILURE_WINDOW_SECONDS)
+
+        excess = failures - settings.LOGIN_MAX_FAILURES
+        if excess >= 0:
+            lockout = min(
+                LOCKOUT_BASE_SECONDS * 2 ** min(excess, 16),
+                settings.LOGIN_FAILURE_WINDOW_SECONDS
+            )
+            await redis.set(_lockout_key(username), 1, ex=lockout)
+    except Exception as e:
+        logger.debug(f"Could not record login failure: {e}")
+
+
+async def clear_login_failures(username: str) -> None:
+    """
+    Reset the failure count for a username after a successful login.
+
+    Args:
+        username: Authenticated username
+    """
+    try:
+        await get_redis().delete(_failures_key(username))
+    except Exception as e:
+        logger.debug(f"Could not clear login failures: {e}")
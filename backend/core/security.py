@@ -1,8 +1,12 @@
 """
 Security utilities for authentication and authorization.
 """
+import hashlib
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Optional
+import anyio
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -10,12 +14,21 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.cache import TTLCache
 from backend.core.config import settings
 from backend.models.base import get_db
 from backend.models.user import User, UserRole
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: Argon2id (OWASP parameters) for new hashes; existing
+# bcrypt hashes still verify and are upgraded on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 # HTTP Bearer for JWT tokens
 security = HTTPBearer()
@@ -31,6 +44,61 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash uses a deprecated scheme.
+
+    Returns:
+        Tuple of (valid, new hash to store or None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# Password hashing is CPU-bound; async callers run it on worker threads,
+# bounded so login bursts cannot exhaust the shared threadpool
+_password_hash_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+
+# Recent successful verifications, so repeated logins with the same
+# credentials (service accounts, reconnect loops) skip the KDF. Keys are
+# keyed hashes of (stored hash, password); failures are never cached.
+_verified_passwords = TTLCache(maxsize=2048, ttl=60)
+
+
+def _verified_password_key(plain_password: str, hashed_password: str) -> bytes:
+    """Build a cache key that does not retain the plaintext password."""
+    return hashlib.blake2b(
+        hashed_password.encode() + b"\0" + plain_password.encode(),
+        key=settings.SECRET_KEY.encode()[:64]
+    ).digest()
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify (and possibly rehash) a password without blocking the event loop."""
+    cache_key = _verified_password_key(plain_password, hashed_password)
+    if cache_key in _verified_passwords:
+        return True, None
+
+    valid, new_hash = await anyio.to_thread.run_sync(
+        verify_and_update_password, plain_password, hashed_password,
+        limiter=_password_hash_limiter
+    )
+    if valid and new_hash is None:
+        _verified_passwords.set(cache_key, True)
+    return valid, new_hash
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await anyio.to_thread.run_sync(
+        get_password_hash, password,
+        limiter=_password_hash_limiter
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -57,10 +125,22 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+# Recently decoded tokens keyed by token digest, so repeated requests with
+# the same token skip signature verification. Entries are not used past
+# the token's own expiry.
+_decoded_tokens = TTLCache(maxsize=10_000, ttl=60)
+
+
 def decode_token(token: str) -> dict:
     """Decode a JWT token."""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=32).digest()
+    payload = _decoded_tokens.get(cache_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        _decoded_tokens.set(cache_key, payload)
         return payload
     except JWTError:
         raise HTTPException(
@@ -88,8 +168,7 @@ async def get_current_user(
 
     # Get user from database
     stmt = select(User).where(User.username == username)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.scalar(stmt)
 
     if user is None:
         raise HTTPException(
@@ -154,8 +233,7 @@ async def get_current_user_from_token(token: str, db: AsyncSession) -> Optional[
 
         # Get user from database
         stmt = select(User).where(User.username == username)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await db.scalar(stmt)
 
         if user is None or not user.is_active:
             return None
@@ -51,6 +51,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️  Failed to setup file logging: {e}")
 
+    # Pre-open database connections so first requests don't pay connect latency
+    if settings.DB_POOL_WARMUP:
+        try:
+            from backend.models.base import warm_up_pool
+            opened = await warm_up_pool()
+            print(f"🔌 Database pool warmed up ({opened} connections)")
+        except Exception as e:
+            print(f"⚠️  Failed to warm up database pool: {e}")
+
     # TODO: In-memory logging still disabled due to SSL issues
     # Database logging works fine (separate thread) but in-memory logging
     # causes SSL connections to hang when attached to fastapi/sqlalchemy loggers
@@ -63,6 +72,10 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down...")
+    from backend.models.base import async_engine
+    from backend.core.cache import close_redis
+    await async_engine.dispose()
+    await close_redis()
 
 
 # Create FastAPI application
@@ -86,6 +99,15 @@ app.add_middleware(
 from backend.middleware.audit_middleware import AuditLoggingMiddleware
 app.add_middleware(AuditLoggingMiddleware)
 
+# Log ORM lazy loads with the request that caused them (development only)
+if settings.DEBUG or settings.DB_WARN_LAZY_LOADS:
+    from backend.middleware.lazy_load_detector import (
+        LazyLoadDetectionMiddleware,
+        install_lazy_load_detection
+    )
+    install_lazy_load_detection()
+    app.add_middleware(LazyLoadDetectionMiddleware)
+
 # Mount static files
 static_dir = Path(__file__).parent / "static"
 if static_dir.exists():
@@ -0,0 +1,73 @@
+"""
+Development aid for catching ORM lazy loads.
+
+Response models read ORM objects via ``from_attributes``; touching an
+unloaded relationship during serialization issues a lazy load per object
+(N+1), and under asyncio it fails outright. When enabled, every lazy load
+is logged with the request that caused it and the calling stack, so such
+regressions show up in development before they reach production.
+
+Enabled with DEBUG or DB_WARN_LAZY_LOADS; adds nothing to the request
+path otherwise.
+"""
+
+import logging
+import os
+import traceback
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# "<METHOD> <path>" of the request being handled, if any
+_current_request: ContextVar[Optional[str]] = ContextVar("lazy_load_request", default=None)
+
+# Application frames included in each warning
+STACK_DEPTH = 8
+
+# Frames from this tree are reported; SQLAlchemy/pydantic internals are not
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _warn_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """Log relationship lazy loads (eager loader queries are ignored)."""
+    if orm_execute_state.lazy_loaded_from is None:
+        return
+
+    path = orm_execute_state.loader_strategy_path
+    relationship = path[-1] if path else "unknown relationship"
+    request = _current_request.get() or "outside request"
+    frames = [
+        frame for frame in traceback.extract_stack()[:-1]
+        if frame.filename.startswith(_BACKEND_DIR)
+    ]
+    stack = "".join(traceback.format_list(frames[-STACK_DEPTH:]))
+    logger.warning(f"Lazy load of {relationship} during {request}\n{stack}")
+
+
+def install_lazy_load_detection() -> None:
+    """Register the lazy load listener on all ORM sessions (idempotent)."""
+    if not event.contains(Session, "do_orm_execute", _warn_on_lazy_load):
+        event.listen(Session, "do_orm_execute", _warn_on_lazy_load)
+
+
+class LazyLoadDetectionMiddleware:
+    """ASGI middleware that tags lazy load warnings with the current request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _current_request.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
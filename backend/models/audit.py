@@ -5,7 +5,7 @@ Related: Issue #9 - Enhance audit logging system
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import String, Integer, Text, ForeignKey, DateTime, ARRAY
+from sqlalchemy import String, Integer, BigInteger, Text, ForeignKey, DateTime, ARRAY, MetaData, Table, Column, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 import enum
@@ -149,3 +149,37 @@ class AuditLog(Base):
 
     # Relationships
     user: Mapped[Optional["User"]] = relationship(foreign_keys=[user_id], viewonly=True)
+
+    __table_args__ = (
+        # Newest-first listings, exports and the statistics tail; covering so
+        # the common filters are index-only (migration f6g7h8i9j0k1)
+        Index(
+            'idx_audit_logs_created_desc_covering',
+            text('created_at DESC'),
+            postgresql_include=['user_id', 'action', 'severity', 'resource_type', 'duration_ms'],
+            postgresql_concurrently=True
+        ),
+        # Login success/failure events for authentication monitoring
+        Index(
+            'idx_audit_logs_login_events',
+            'action', 'created_at',
+            postgresql_where=text(
+                "action IN ('AUTH_LOGIN_SUCCESS', 'AUTH_LOGIN_FAILURE', 'LOGIN_SUCCESS', 'LOGIN_FAILURE')"
+            ),
+            postgresql_concurrently=True
+        ),
+    )
+
+
+# Hourly rollup of audit_logs maintained as a PostgreSQL materialized view.
+# Declared on its own MetaData so it is never created as a regular table;
+# see migration e5f6g7h8i9j0 and the refresh-audit-stats beat task.
+audit_stats_hourly = Table(
+    "audit_stats_hourly",
+    MetaData(),
+    Column("hour", DateTime(timezone=True)),
+    Column("action", String(100)),
+    Column("severity", String(20)),
+    Column("username", String(100)),
+    Column("count", BigInteger),
+)
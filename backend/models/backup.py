@@ -3,7 +3,7 @@ Backup schedule and backup models.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy import String, Integer, BigInteger, Boolean, JSON, ForeignKey, DateTime, Enum as SQLEnum, Text, Float
+from sqlalchemy import String, Integer, BigInteger, Boolean, JSON, ForeignKey, DateTime, Enum as SQLEnum, Text, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
@@ -35,6 +35,7 @@ class BackupStatus(str, enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    DELETING = "deleting"
 
 
 class BackupMode(str, enum.Enum):
@@ -398,6 +399,30 @@ class Backup(Base):
         viewonly=True
     )
 
+    __table_args__ = (
+        # Latest completed full backup per source (incremental parent lookup,
+        # covering so it is an index-only scan)
+        Index(
+            'ix_backups_parent_lookup',
+            'source_type', 'source_id', text('completed_at DESC'),
+            postgresql_include=['id'],
+            postgresql_where=text("backup_mode = 'full' AND status = 'completed'")
+        ),
+        # Newest-first listing and keyset pagination
+        Index('ix_backups_created_at_id', text('created_at DESC'), text('id DESC')),
+        # Recent completed / in-progress listings (dashboard status filters)
+        Index(
+            'ix_backups_recent_completed',
+            text('created_at DESC'), text('id DESC'),
+            postgresql_where=text("status = 'completed'")
+        ),
+        Index(
+            'ix_backups_recent_running',
+            text('created_at DESC'), text('id DESC'),
+            postgresql_where=text("status = 'running'")
+        ),
+    )
+
     @property
     def job_id(self) -> Optional[int]:
         """Get the associated job ID for this backup."""
@@ -3,7 +3,7 @@ Infrastructure models for KVM hosts, VMs, Podman hosts, and containers.
 """
 from typing import Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy import String, Integer, Boolean, JSON, ForeignKey, DateTime, Text
+from sqlalchemy import String, Integer, Boolean, JSON, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -175,6 +175,11 @@ class VM(Base):
         primaryjoin="and_(VM.id==BackupSchedule.source_id, BackupSchedule.source_type=='vm')"
     )
 
+    __table_args__ = (
+        # Compliance listings filtered by status, paged by ID
+        Index('ix_vms_compliance_status_id', 'compliance_status', 'id'),
+    )
+
 
 class PodmanHost(Base):
     """Podman host configuration."""
@@ -243,3 +248,8 @@ class Container(Base):
         viewonly=True,
         primaryjoin="and_(Container.id==BackupSchedule.source_id, BackupSchedule.source_type=='container')"
     )
+
+    __table_args__ = (
+        # Compliance listings filtered by status, paged by ID
+        Index('ix_containers_compliance_status_id', 'compliance_status', 'id'),
+    )
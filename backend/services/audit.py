@@ -7,16 +7,37 @@ Related: Issue #9 - Enhance audit logging system
 """
 import logging
 import json
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from sqlalchemy import select, and_, or_, func
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, AsyncIterator
+from sqlalchemy import select, and_, or_, func, union_all, text, literal, literal_column, lambda_stmt
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from backend.models.audit import AuditLog, AuditAction, AuditSeverity, ResourceType
+from backend.models.audit import AuditLog, AuditAction, AuditSeverity, ResourceType, audit_stats_hourly
 from backend.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per server-side cursor round-trip when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Above this many planner-estimated rows, list totals use the estimate
+# instead of an exact count(*)
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+# Dialect used to render statements for EXPLAIN with named bind params
+_EXPLAIN_DIALECT = postgresql.dialect(paramstyle="named")
+
+# JSONB payload columns not shown in log listings
+_LIST_DEFERRED = (
+    defer(AuditLog.request_data),
+    defer(AuditLog.audit_metadata),
+    defer(AuditLog.details),
+)
+
 
 class AuditLogService:
     """Service for creating and querying audit logs."""
@@ -28,6 +49,12 @@ class AuditLogService:
         'auth_token', 'refresh_token', 'jwt', 'credentials'
     }
 
+    # Indexed columns that may be listed with get_distinct_values
+    DISTINCT_VALUE_COLUMNS = {'action', 'resource_type'}
+
+    # Statistics windows at least this long are served from audit_stats_hourly
+    ROLLUP_MIN_WINDOW = timedelta(days=1)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize audit log service.
@@ -229,6 +256,152 @@ class AuditLogService:
             tags=["resource", resource_type.lower()]
         )
 
+    @staticmethod
+    def _resolve_usernames(rows) -> List[AuditLog]:
+        """
+        Fill in missing username snapshots from joined User rows.
+
+        API request logs only record user_id, so the username is taken from
+        the outer-joined users table. The value is set as committed state so
+        the audit rows are never marked dirty and written back.
+
+        Args:
+            rows: Result rows of (AuditLog, username)
+
+        Returns:
+            List of AuditLog instances
+        """
+        logs = []
+        for log, username in rows:
+            if log.username is None and username is not None:
+                set_committed_value(log, "username", username)
+            logs.append(log)
+        return logs
+
+    @staticmethod
+    def _apply_filters(
+        stmt: StatementLambdaElement,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        ip_address: Optional[str] = None
+    ) -> StatementLambdaElement:
+        """
+        Add the optional audit log query filters to a lambda statement.
+
+        Each present filter appends its own lambda, so SQLAlchemy caches one
+        statement per combination of filters and only re-binds the values.
+        """
+        if user_id is not None:
+            stmt += lambda s: s.where(AuditLog.user_id == user_id)
+        if action:
+            stmt += lambda s: s.where(AuditLog.action == action)
+        if resource_type:
+            stmt += lambda s: s.where(AuditLog.resource_type == resource_type)
+        if resource_id is not None:
+            stmt += lambda s: s.where(AuditLog.resource_id == resource_id)
+        if severity:
+            stmt += lambda s: s.where(AuditLog.severity == severity)
+        if start_date:
+            stmt += lambda s: s.where(AuditLog.created_at >= start_date)
+        if end_date:
+            stmt += lambda s: s.where(AuditLog.created_at <= end_date)
+        if ip_address:
+            stmt += lambda s: s.where(AuditLog.ip_address == ip_address)
+        return stmt
+
+    @staticmethod
+    def _select_logs() -> StatementLambdaElement:
+        """Base listing query: logs with the joined username, JSONB payloads deferred."""
+        return lambda_stmt(
+            lambda: select(AuditLog, User.username).outerjoin(
+                User, User.id == AuditLog.user_id
+            ).options(*_LIST_DEFERRED)
+        )
+
+    async def count_logs(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        ip_address: Optional[str] = None,
+        exact: bool = True
+    ) -> int:
+        """
+        Count audit logs matching filters.
+
+        count(*) scans every matching row, which is slow on large audit
+        tables. With ``exact=False`` the planner's row estimate is returned
+        instead when it exceeds ESTIMATED_COUNT_THRESHOLD; smaller results
+        are still counted exactly.
+
+        Args:
+            user_id: Filter by user ID
+            action: Filter by action
+            resource_type: Filter by resource type
+            resource_id: Filter by resource ID
+            severity: Filter by severity
+            start_date: Filter by start date
+            end_date: Filter by end date
+            ip_address: Filter by IP address
+            exact: Always run an exact count
+
+        Returns:
+            Number of matching logs (approximate if large and not exact)
+        """
+        filters = dict(
+            user_id=user_id,
+            action=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            severity=severity,
+            start_date=start_date,
+            end_date=end_date,
+            ip_address=ip_address
+        )
+
+        if not exact:
+            estimate = await self._estimate_rows(
+                self._apply_filters(lambda_stmt(lambda: select(AuditLog.id)), **filters)
+            )
+            if estimate > ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+
+        stmt = self._apply_filters(
+            lambda_stmt(lambda: select(func.count()).select_from(AuditLog)),
+            **filters
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar()
+
+    async def _estimate_rows(self, stmt: StatementLambdaElement) -> int:
+        """
+        Get the planner's row estimate for a statement without running it.
+
+        Args:
+            stmt: Statement to estimate
+
+        Returns:
+            Estimated row count from EXPLAIN
+        """
+        compiled = stmt.compile(dialect=_EXPLAIN_DIALECT)
+        result = await self.db.execute(
+            text(f"EXPLAIN (FORMAT JSON) {compiled}"),
+            compiled.params
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def query_logs(
         self,
         user_id: Optional[int] = None,
@@ -240,7 +413,8 @@ class AuditLogService:
         end_date: Optional[datetime] = None,
         ip_address: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        exact_count: bool = True
     ) -> tuple[List[AuditLog], int]:
         """
         Query audit logs with filters.
@@ -256,48 +430,129 @@ class AuditLogService:
             ip_address: Filter by IP address
             limit: Maximum results
             offset: Results offset
+            exact_count: Count matches exactly instead of estimating large totals
 
         Returns:
             Tuple of (logs list, total count)
         """
-        # Build query
-        stmt = select(AuditLog)
-        count_stmt = select(func.count()).select_from(AuditLog)
-
-        # Apply filters
-        filters = []
-        if user_id is not None:
-            filters.append(AuditLog.user_id == user_id)
-        if action:
-            filters.append(AuditLog.action == action)
-        if resource_type:
-            filters.append(AuditLog.resource_type == resource_type)
-        if resource_id is not None:
-            filters.append(AuditLog.resource_id == resource_id)
-        if severity:
-            filters.append(AuditLog.severity == severity)
-        if start_date:
-            filters.append(AuditLog.created_at >= start_date)
-        if end_date:
-            filters.append(AuditLog.created_at <= end_date)
-        if ip_address:
-            filters.append(AuditLog.ip_address == ip_address)
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-            count_stmt = count_stmt.where(and_(*filters))
+        filters = dict(
+            user_id=user_id,
+            action=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            severity=severity,
+            start_date=start_date,
+            end_date=end_date,
+            ip_address=ip_address
+        )
 
         # Get total count
-        total = await self.db.execute(count_stmt)
-        total_count = total.scalar()
+        total_count = await self.count_logs(**filters, exact=exact_count)
 
-        # Get logs
-        stmt = stmt.order_by(AuditLog.created_at.desc()).limit(limit).offset(offset)
+        # Get logs (users joined once instead of resolved per row)
+        stmt = self._apply_filters(self._select_logs(), **filters)
+        stmt += lambda s: s.order_by(AuditLog.created_at.desc()).limit(limit).offset(offset)
         result = await self.db.execute(stmt)
-        logs = list(result.scalars().all())
+        logs = self._resolve_usernames(result.all())
 
         return logs, total_count
 
+    async def stream_log_batches(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 10000,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[List[AuditLog]]:
+        """
+        Stream audit logs matching filters from a server-side cursor in batches.
+
+        Rows are fetched in batches of ``batch_size`` so exports hold only
+        one batch in memory regardless of ``limit``.
+
+        Args:
+            user_id: Filter by user ID
+            action: Filter by action
+            resource_type: Filter by resource type
+            severity: Filter by severity
+            start_date: Filter by start date
+            end_date: Filter by end date
+            limit: Maximum results
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Lists of up to ``batch_size`` AuditLog instances, newest first
+        """
+        stmt = self._apply_filters(
+            lambda_stmt(lambda: select(AuditLog, User.username).outerjoin(User, User.id == AuditLog.user_id)),
+            user_id=user_id,
+            action=action,
+            resource_type=resource_type,
+            severity=severity,
+            start_date=start_date,
+            end_date=end_date
+        )
+        stmt += lambda s: s.order_by(AuditLog.created_at.desc()).limit(limit)
+        result = await self.db.stream(stmt, execution_options={"stream_results": True, "yield_per": batch_size})
+
+        async for partition in result.partitions():
+            yield self._resolve_usernames(partition)
+
+    async def stream_row_batches(
+        self,
+        columns: tuple,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 10000,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[list]:
+        """
+        Stream a column projection of audit logs matching filters in batches.
+
+        Unlike stream_log_batches, no ORM instances are hydrated and only the
+        requested columns are transferred. ``users`` is outer-joined so
+        projections may reference User columns.
+
+        Args:
+            columns: Column expressions to select
+            user_id: Filter by user ID
+            action: Filter by action
+            resource_type: Filter by resource type
+            severity: Filter by severity
+            start_date: Filter by start date
+            end_date: Filter by end date
+            limit: Maximum results
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Lists of up to ``batch_size`` row tuples in ``columns`` order,
+            newest first
+        """
+        stmt = self._apply_filters(
+            lambda_stmt(
+                lambda: select(*columns).select_from(AuditLog).outerjoin(User, User.id == AuditLog.user_id)
+            ),
+            user_id=user_id,
+            action=action,
+            resource_type=resource_type,
+            severity=severity,
+            start_date=start_date,
+            end_date=end_date
+        )
+        stmt += lambda s: s.order_by(AuditLog.created_at.desc()).limit(limit)
+        result = await self.db.stream(stmt, execution_options={"stream_results": True, "yield_per": batch_size})
+
+        async for partition in result.partitions():
+            yield partition
+
     async def get_recent_activity(
         self,
         user_id: Optional[int] = None,
@@ -313,16 +568,110 @@ class AuditLogService:
         Returns:
             List of recent AuditLog entries
         """
-        stmt = select(AuditLog)
+        stmt = self._apply_filters(self._select_logs(), user_id=user_id)
+        stmt += lambda s: s.order_by(AuditLog.created_at.desc()).limit(limit)
 
-        if user_id is not None:
-            stmt = stmt.where(AuditLog.user_id == user_id)
+        result = await self.db.execute(stmt)
+        return self._resolve_usernames(result.all())
 
-        stmt = stmt.order_by(AuditLog.created_at.desc()).limit(limit)
+    async def get_distinct_values(self, column: str) -> List[str]:
+        """
+        Get the distinct non-null values of an indexed audit log column.
+
+        Uses a recursive CTE ("loose index scan") that jumps through the
+        column's B-tree index one distinct value at a time, so the cost grows
+        with the number of distinct values rather than the table size.
+
+        Args:
+            column: Column name, one of DISTINCT_VALUE_COLUMNS
 
+        Returns:
+            Sorted list of distinct values
+        """
+        if column not in self.DISTINCT_VALUE_COLUMNS:
+            raise ValueError(f"Unsupported column for distinct lookup: {column}")
+
+        # Column name is whitelisted above, so interpolation is safe
+        stmt = text(f"""
+            WITH RECURSIVE t AS (
+                (SELECT {column} AS value FROM audit_logs
+                 WHERE {column} IS NOT NULL ORDER BY {column} LIMIT 1)
+                UNION ALL
+                SELECT (SELECT {column} FROM audit_logs
+                        WHERE {column} > t.value ORDER BY {column} LIMIT 1)
+                FROM t WHERE t.value IS NOT NULL
+            )
+            SELECT value FROM t WHERE value IS NOT NULL
+        """)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def refresh_statistics_rollup(self) -> None:
+        """Refresh the audit_stats_hourly materialized view without blocking readers."""
+        await self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY audit_stats_hourly"))
+        await self.db.commit()
+
+    def _statistics_source(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ):
+        """
+        Build the (action, severity, username, count) source for statistics.
+
+        Windows of at least ROLLUP_MIN_WINDOW read complete hours from the
+        audit_stats_hourly materialized view and group the raw table only
+        from the view's watermark on. Shorter or open-ended windows group the
+        raw table directly. Rollup windows are aligned to whole hours.
+
+        The view's newest bucket is the hour it was last refreshed in and may
+        be partial, and a refresh can lag behind an hour boundary, so the
+        watermark is that newest bucket rather than the current hour.
+        """
+        # Literal (not a bind param) so the GROUP BY matches the select list
+        username_expr = func.coalesce(AuditLog.username, User.username, literal_column("''"))
+
+        def raw_counts(*filters):
+            stmt = select(
+                AuditLog.action,
+                AuditLog.severity,
+                username_expr.label('username'),
+                func.count(AuditLog.id).label('count')
+            ).outerjoin(User, User.id == AuditLog.user_id)
+            if filters:
+                stmt = stmt.where(and_(*filters))
+            return stmt.group_by(AuditLog.action, AuditLog.severity, username_expr)
+
+        if start_date is None or end_date is None or end_date - start_date < self.ROLLUP_MIN_WINDOW:
+            filters = []
+            if start_date:
+                filters.append(AuditLog.created_at >= start_date)
+            if end_date:
+                filters.append(AuditLog.created_at <= end_date)
+            return raw_counts(*filters).subquery()
+
+        hour_type = audit_stats_hourly.c.hour.type
+        start_hour = literal(start_date.replace(minute=0, second=0, microsecond=0), hour_type)
+        end_hour = literal(end_date.replace(minute=0, second=0, microsecond=0), hour_type)
+
+        # Hours before the view's newest bucket are complete; GREATEST skips
+        # the NULL of an empty view, falling back to the raw table throughout
+        watermark = select(func.max(audit_stats_hourly.c.hour)).scalar_subquery()
+        boundary = func.least(end_hour, func.greatest(start_hour, watermark))
+
+        rollup = select(
+            audit_stats_hourly.c.action,
+            audit_stats_hourly.c.severity,
+            audit_stats_hourly.c.username,
+            audit_stats_hourly.c.count
+        ).where(
+            audit_stats_hourly.c.hour >= start_hour,
+            audit_stats_hourly.c.hour < boundary
+        )
+        tail = raw_counts(AuditLog.created_at >= boundary, AuditLog.created_at <= end_date)
+
+        return union_all(rollup, tail).subquery()
+
     async def get_statistics(
         self,
         start_date: Optional[datetime] = None,
@@ -338,50 +687,38 @@ class AuditLogService:
         Returns:
             Dictionary with statistics
         """
-        filters = []
-        if start_date:
-            filters.append(AuditLog.created_at >= start_date)
-        if end_date:
-            filters.append(AuditLog.created_at <= end_date)
-
-        where_clause = and_(*filters) if filters else None
+        source = self._statistics_source(start_date, end_date)
+        count_sum = func.sum(source.c.count)
 
-        # Total logs
-        total_stmt = select(func.count()).select_from(AuditLog)
-        if where_clause is not None:
-            total_stmt = total_stmt.where(where_clause)
-        total_result = await self.db.execute(total_stmt)
-        total = total_result.scalar()
-
-        # By severity
+        # By severity (severity is NOT NULL, so these counts also sum to the total)
         severity_stmt = select(
-            AuditLog.severity,
-            func.count(AuditLog.id).label('count')
-        ).group_by(AuditLog.severity)
-        if where_clause is not None:
-            severity_stmt = severity_stmt.where(where_clause)
-        severity_result = await self.db.execute(severity_stmt)
-        by_severity = {row.severity: row.count for row in severity_result}
+            source.c.severity,
+            count_sum.label('count')
+        ).group_by(source.c.severity)
 
         # By action (top 10)
         action_stmt = select(
-            AuditLog.action,
-            func.count(AuditLog.id).label('count')
-        ).group_by(AuditLog.action).order_by(func.count(AuditLog.id).desc()).limit(10)
-        if where_clause is not None:
-            action_stmt = action_stmt.where(where_clause)
-        action_result = await self.db.execute(action_stmt)
-        top_actions = {row.action: row.count for row in action_result}
-
-        # By user (top 10)
+            source.c.action,
+            count_sum.label('count')
+        ).group_by(source.c.action).order_by(count_sum.desc()).limit(10)
+
+        # By user (top 10); usernames are already resolved in the source
         user_stmt = select(
-            AuditLog.username,
-            func.count(AuditLog.id).label('count')
-        ).where(AuditLog.username.isnot(None)).group_by(AuditLog.username).order_by(func.count(AuditLog.id).desc()).limit(10)
-        if where_clause is not None:
-            user_stmt = user_stmt.where(where_clause)
-        user_result = await self.db.execute(user_stmt)
-        top_users = {row.username: row.count for row in user_result}
+            source.c.username,
+            count_sum.label('count')
+        ).where(source.c.username != '').group_by(source.c.username).order_by(count_sum.desc()).limit(10)
+
+        # The source is mostly the small hourly rollup, so the group-bys run
+        # on the request's session rather than holding extra pool connections
+        severity_rows = (await self.db.execute(severity_stmt)).all()
+        action_rows = (await self.db.execute(action_stmt)).all()
+        user_rows = (await self.db.execute(user_stmt)).all()
+
+        # SUM() over bigint comes back as numeric
+        by_severity = {row.severity: int(row.count) for row in severity_rows}
+        top_actions = {row.action: int(row.count) for row in action_rows}
+        top_users = {row.username: int(row.count) for row in user_rows}
+        total = sum(by_severity.values())
 
         return {
             "total_logs": total,
@@ -12,11 +12,12 @@ Related: Issue #9 - Enhance Audit Logging System
 
 import logging
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Awaitable
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.audit import AuditLog
+from backend.models.base import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -394,3 +395,22 @@ class AuditLogger:
             duration_ms=duration_ms,
             severity=severity
         )
+
+
+async def log_detached(log_method: Callable[..., Awaitable[AuditLog]], **kwargs) -> None:
+    """
+    Write an audit event on its own session.
+
+    For use with FastAPI BackgroundTasks, which run after the response is
+    sent and the request's session is closed. Failures are logged here
+    and not re-raised, since there is no request left to fail.
+
+    Args:
+        log_method: Unbound AuditLogger method, e.g. AuditLogger.log_authentication
+        **kwargs: Arguments for the log method
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            await log_method(AuditLogger(db), **kwargs)
+    except Exception:
+        logger.exception("Detached audit log failed")
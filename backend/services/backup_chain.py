@@ -11,8 +11,9 @@ import logging
 import uuid
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import Select, select, func, and_, or_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.models.backup import Backup, BackupMode, BackupStatus, SourceType
 
@@ -169,6 +170,25 @@ class BackupChainService:
             f"space_saved={backup.space_saved_bytes / (1024**3):.2f} GB"
         )
 
+    @staticmethod
+    def chain_conditions(chain_id: str, include_failed: bool = False) -> list:
+        """
+        Build the filter selecting the backups of a chain.
+
+        Args:
+            chain_id: Chain UUID
+            include_failed: Include failed backups
+
+        Returns:
+            List of SQL conditions
+        """
+        conditions = [Backup.chain_id == chain_id]
+
+        if not include_failed:
+            conditions.append(Backup.status == BackupStatus.COMPLETED)
+
+        return conditions
+
     async def get_backup_chain(
         self,
         chain_id: str,
@@ -184,10 +204,7 @@ class BackupChainService:
         Returns:
             List of backups in chain order
         """
-        conditions = [Backup.chain_id == chain_id]
-
-        if not include_failed:
-            conditions.append(Backup.status == BackupStatus.COMPLETED)
+        conditions = self.chain_conditions(chain_id, include_failed)
 
         stmt = (
             select(Backup)
@@ -198,32 +215,31 @@ class BackupChainService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def find_orphaned_backups(self) -> List[Backup]:
+    @staticmethod
+    def orphaned_backups_query(*columns) -> Select:
         """
-        Find backups whose parent was deleted.
+        Build a query for backups whose parent was deleted.
+
+        Args:
+            columns: Entities or columns to select
 
         Returns:
-            List of orphaned backups (parent_backup_id points to non-existent backup)
+            Select statement
         """
-        # Subquery to find all valid backup IDs
-        valid_ids_subq = select(Backup.id).subquery()
-
-        # Find backups with parent_backup_id not in valid IDs
-        stmt = select(Backup).where(
-            and_(
-                Backup.parent_backup_id.isnot(None),
-                Backup.parent_backup_id.notin_(select(valid_ids_subq))
+        # Anti-join against the parent row: one index probe per candidate
+        parent = aliased(Backup)
+        return (
+            select(*columns)
+            .select_from(Backup)
+            .outerjoin(parent, parent.id == Backup.parent_backup_id)
+            .where(
+                and_(
+                    Backup.parent_backup_id.isnot(None),
+                    parent.id.is_(None)
+                )
             )
         )
 
-        result = await self.db.execute(stmt)
-        orphaned = list(result.scalars().all())
-
-        if orphaned:
-            logger.warning(f"Found {len(orphaned)} orphaned backups")
-
-        return orphaned
-
     async def get_backup_children(self, backup_id: int) -> List[Backup]:
         """
         Get all child backups (incrementals) that depend on this backup.
@@ -251,13 +267,46 @@ class BackupChainService:
             Tuple of (can_delete, reason_if_not)
         """
         children = await self.get_backup_children(backup_id)
+        return self._check_dependents(backup_id, [c.id for c in children])
+
+    async def get_backup_for_delete(
+        self,
+        backup_id: int
+    ) -> Tuple[Optional[Backup], bool, Optional[str]]:
+        """
+        Load a backup together with its chain delete check in one query.
+
+        Args:
+            backup_id: Backup to check
+
+        Returns:
+            Tuple of (backup or None, can_delete, reason_if_not)
+        """
+        child = aliased(Backup)
+        child_ids = (
+            select(func.array_agg(child.id))
+            .where(child.parent_backup_id == Backup.id)
+            .correlate(Backup)
+            .scalar_subquery()
+        )
+        stmt = select(Backup, child_ids).where(Backup.id == backup_id)
+        row = (await self.db.execute(stmt)).one_or_none()
+
+        if row is None:
+            return None, False, f"Backup {backup_id} not found"
+
+        backup, dependents = row
+        can_delete, reason = self._check_dependents(backup_id, dependents or [])
+        return backup, can_delete, reason
 
-        if children:
-            child_ids = [str(c.id) for c in children]
+    @staticmethod
+    def _check_dependents(backup_id: int, child_ids: List[int]) -> Tuple[bool, Optional[str]]:
+        """Build the chain delete result from a backup's dependent IDs."""
+        if child_ids:
             return (
                 False,
                 f"Cannot delete backup {backup_id}: "
-                f"has {len(children)} dependent backup(s): {', '.join(child_ids)}"
+                f"has {len(child_ids)} dependent backup(s): {', '.join(map(str, child_ids))}"
             )
 
         return (True, None)
@@ -14,12 +14,21 @@ from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.cache import ResponseCache
+from backend.core.config import settings
 from backend.models.infrastructure import VM, Container
 from backend.models.backup import BackupSchedule, Backup, BackupStatus, SourceType
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Serialized compliance dashboard. Statuses only change in
+# update_vm_compliance/update_container_compliance, which invalidate the
+# entry (other API processes keep their in-process copy until it expires).
+compliance_dashboard_cache = ResponseCache(
+    "compliance_dashboard", ttl=settings.STATS_CACHE_TTL, maxsize=1
+)
+
 
 class ComplianceStatus:
     """Compliance status constants."""
@@ -229,6 +238,7 @@ class ComplianceService:
         vm.compliance_last_checked = datetime.utcnow()
 
         await self.db.commit()
+        await compliance_dashboard_cache.invalidate("global")
 
         # Log status changes
         if old_status != status:
@@ -278,6 +288,7 @@ class ComplianceService:
         container.compliance_last_checked = datetime.utcnow()
 
         await self.db.commit()
+        await compliance_dashboard_cache.invalidate("global")
 
         # Log status changes
         if old_status != status:
@@ -115,6 +115,27 @@ class ImmutabilityService:
         if not backup:
             return False, f"Backup {backup_id} not found"
 
+        return self.check_can_delete(backup, is_admin, override_governance)
+
+    def check_can_delete(
+        self,
+        backup: Backup,
+        is_admin: bool = False,
+        override_governance: bool = False
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check the retention rules of an already loaded backup.
+
+        Args:
+            backup: Backup to check
+            is_admin: Whether user has admin privileges
+            override_governance: Whether admin is overriding GOVERNANCE mode
+
+        Returns:
+            Tuple of (can_delete, reason)
+        """
+        backup_id = backup.id
+
         # Not immutable - can delete
         if not backup.immutable:
             return True, None
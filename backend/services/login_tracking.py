@@ -0,0 +1,81 @@
+"""
+Batched last-login tracking.
+
+Successful logins record the login time in a Redis hash instead of
+issuing an UPDATE + COMMIT per login. A periodic worker task writes all
+pending timestamps to users.last_login with a single UPDATE.
+"""
+import logging
+from datetime import datetime
+from sqlalchemy import update, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import get_redis
+from backend.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Redis hash of user_id -> ISO login time awaiting flush
+PENDING_LAST_LOGIN_KEY = "pending:last_login"
+FLUSHING_LAST_LOGIN_KEY = "pending:last_login:flushing"
+
+
+async def record_last_login(db: AsyncSession, user_id: int, logged_in_at: datetime) -> None:
+    """
+    Queue a user's last login time for the next batch flush.
+
+    Falls back to updating the row in the current session if Redis is
+    unavailable (the caller's commit persists it).
+
+    Args:
+        db: Database session for the fallback update
+        user_id: ID of the user who logged in
+        logged_in_at: Login time
+    """
+    try:
+        await get_redis().hset(PENDING_LAST_LOGIN_KEY, str(user_id), logged_in_at.isoformat())
+    except Exception as e:
+        logger.warning(f"Could not queue last_login for user {user_id}, writing directly: {e}")
+        await db.execute(
+            update(User).where(User.id == user_id).values(last_login=logged_in_at)
+        )
+
+
+async def flush_last_logins(db: AsyncSession) -> int:
+    """
+    Write all queued last login times with one UPDATE.
+
+    Pending entries are renamed aside first so logins recorded during the
+    flush are kept for the next run. A batch left over from a failed
+    flush is retried before new entries are taken.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of users updated
+    """
+    redis = get_redis()
+
+    if not await redis.exists(FLUSHING_LAST_LOGIN_KEY):
+        if not await redis.exists(PENDING_LAST_LOGIN_KEY):
+            return 0
+        await redis.rename(PENDING_LAST_LOGIN_KEY, FLUSHING_LAST_LOGIN_KEY)
+
+    pending = await redis.hgetall(FLUSHING_LAST_LOGIN_KEY)
+    last_logins = {
+        int(user_id): datetime.fromisoformat(logged_in_at.decode())
+        for user_id, logged_in_at in pending.items()
+    }
+
+    if last_logins:
+        await db.execute(
+            update(User)
+            .where(User.id.in_(last_logins))
+            .values(last_login=case(last_logins, value=User.id))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    await redis.delete(FLUSHING_LAST_LOGIN_KEY)
+    return len(last_logins)
@@ -0,0 +1,54 @@
+"""
+Cached access to system settings.
+
+System settings change rarely but some are read on hot request paths
+(e.g. default retention when triggering a backup). Typed values are cached
+in-process for a short TTL; writes through the settings API invalidate the
+local cache, and other processes pick up changes when entries expire.
+"""
+from typing import Any, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import TTLCache
+from backend.models.settings import SystemSetting
+
+SETTINGS_CACHE_TTL = 60
+
+_settings_cache = TTLCache(maxsize=256, ttl=SETTINGS_CACHE_TTL)
+_MISSING = object()
+
+
+async def get_system_setting(db: AsyncSession, key: str, default: Any = None) -> Any:
+    """
+    Get a system setting's typed value.
+
+    Args:
+        db: Database session
+        key: Setting key
+        default: Value returned if the setting is missing or empty
+
+    Returns:
+        Typed setting value, or ``default``
+    """
+    value = _settings_cache.get(key, _MISSING)
+    if value is _MISSING:
+        stmt = select(SystemSetting).where(SystemSetting.key == key)
+        setting = await db.scalar(stmt)
+        value = setting.get_typed_value() if setting else None
+        _settings_cache.set(key, value)
+
+    return default if value is None else value
+
+
+def invalidate_system_settings(key: Optional[str] = None) -> None:
+    """
+    Drop cached setting values after a write.
+
+    Args:
+        key: Setting key to drop, or None to drop all
+    """
+    if key is None:
+        _settings_cache.clear()
+    else:
+        _settings_cache.pop(key)
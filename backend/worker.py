@@ -11,8 +11,10 @@ from typing import Optional
 from celery import Celery
 from celery.schedules import crontab
 from sqlalchemy import select, func, and_
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.attributes import flag_modified
 
+from backend.core.cache import close_redis
 from backend.core.config import settings
 from backend.core.logging_handler import LoggingContext
 from backend.models.base import AsyncSessionLocal
@@ -61,6 +63,19 @@ async def log_job_verbose(db, job_id: int, level: str, message: str, details: di
     await db.flush()  # Use flush instead of commit for batching
 
 
+async def _with_redis_closed(coro):
+    """
+    Await a task's coroutine, then close the Redis client of its event loop.
+
+    Tasks run in a fresh loop (asyncio.run); a client left open would keep
+    its sockets after the loop is gone.
+    """
+    try:
+        return await coro
+    finally:
+        await close_redis()
+
+
 # Initialize Celery
 celery_app = Celery(
     "lab_backup",
@@ -71,6 +86,8 @@ celery_app = Celery(
 celery_app.conf.update(
     task_track_started=settings.CELERY_TASK_TRACK_STARTED,
     task_time_limit=settings.CELERY_TASK_TIME_LIMIT,
+    worker_concurrency=settings.CELERY_WORKER_CONCURRENCY,
+    worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
     task_serializer="json",
     result_serializer="json",
     accept_content=["json"],
@@ -116,6 +133,14 @@ celery_app.conf.beat_schedule = {
         "task": "backend.worker.send_daily_compliance_summary",
         "schedule": crontab(hour="7", minute="0"),  # Daily at 7 AM
     },
+    "refresh-audit-stats": {
+        "task": "backend.worker.refresh_audit_stats",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
+    "flush-last-logins": {
+        "task": "backend.worker.flush_last_logins",
+        "schedule": crontab(),  # Every minute
+    },
 }
 
 
@@ -1721,6 +1746,94 @@ async def _cleanup_expired_backups_async():
         return {"deleted_count": deleted_count}
 
 
+@celery_app.task(
+    name="backend.worker.reclaim_backup_storage",
+    bind=True,
+    max_retries=5,
+    default_retry_delay=60
+)
+def reclaim_backup_storage(self, backup_id: int, previous_status: str, bypass_governance: bool = False):
+    """
+    Delete a backup from storage and then from the database.
+
+    Queued by the delete endpoint after it marks the backup DELETING, so the
+    API does not wait on remote storage. Storage failures are retried; once
+    retries are exhausted the backup is returned to its previous status with
+    the error recorded, so the delete can be attempted again.
+
+    Args:
+        backup_id: ID of the backup being deleted
+        previous_status: Status to restore if the delete cannot be completed
+        bypass_governance: Bypass S3 Object Lock GOVERNANCE retention
+    """
+    import asyncio
+    try:
+        return asyncio.run(_reclaim_backup_storage_async(backup_id, previous_status, bypass_governance))
+    except Exception as e:
+        if self.request.retries >= self.max_retries:
+            logger.error(
+                f"Storage delete for backup {backup_id} failed after {self.max_retries} retries: {e}"
+            )
+            asyncio.run(_abort_backup_reclaim_async(backup_id, previous_status, str(e)))
+            return {"success": False, "error": str(e)}
+
+        logger.warning(f"Storage delete for backup {backup_id} failed, retrying: {e}")
+        raise self.retry(exc=e)
+
+
+async def _abort_backup_reclaim_async(backup_id: int, previous_status: str, error: str):
+    """Move a backup out of DELETING after its storage delete gave up."""
+    async with AsyncSessionLocal() as db:
+        backup = await db.get(Backup, backup_id)
+        if backup and backup.status == BackupStatus.DELETING:
+            backup.status = BackupStatus(previous_status)
+            backup.error_message = f"Storage delete failed: {error}"
+            await db.commit()
+
+
+async def _reclaim_backup_storage_async(backup_id: int, previous_status: str, bypass_governance: bool):
+    """Async implementation of backup storage reclaim."""
+    async with AsyncSessionLocal() as db:
+        # Load the storage backend with the backup in one round trip
+        stmt = (
+            select(Backup)
+            .options(joinedload(Backup.storage_backend))
+            .where(Backup.id == backup_id)
+        )
+        result = await db.execute(stmt)
+        backup = result.scalar_one_or_none()
+        if not backup:
+            return {"success": True, "deleted": False}
+
+        # Delete from storage
+        if backup.storage_path:
+            storage_backend = backup.storage_backend
+            if storage_backend:
+                storage = create_storage_backend(storage_backend.type, storage_backend.config)
+
+                # For S3 with Object Lock, pass override flag
+                if storage_backend.type == "s3":
+                    await storage.delete(backup.storage_path, bypass_governance=bypass_governance)
+                else:
+                    await storage.delete(backup.storage_path)
+
+        # Delete from database (may be blocked by PostgreSQL trigger)
+        try:
+            await db.delete(backup)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Database refused deletion of backup {backup_id}: {e}")
+
+            backup = await db.get(Backup, backup_id)
+            if backup:
+                backup.status = BackupStatus(previous_status)
+                await db.commit()
+            return {"success": False, "error": str(e)}
+
+        return {"success": True, "deleted": True}
+
+
 @celery_app.task(name="backend.worker.update_storage_usage")
 def update_storage_usage():
     """Update storage usage statistics for all backends."""
@@ -1819,6 +1932,46 @@ async def _cleanup_logs_async():
         return {"error": str(e)}
 
 
+@celery_app.task(name="backend.worker.refresh_audit_stats")
+def refresh_audit_stats():
+    """Refresh the hourly audit statistics rollup (Issue #9)."""
+    import asyncio
+    return asyncio.run(_refresh_audit_stats_async())
+
+
+async def _refresh_audit_stats_async():
+    """Async implementation of audit statistics rollup refresh."""
+    from backend.services.audit import AuditLogService
+
+    async with AsyncSessionLocal() as db:
+        try:
+            await AuditLogService(db).refresh_statistics_rollup()
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Audit statistics refresh failed: {e}")
+            return {"success": False, "error": str(e)}
+
+
+@celery_app.task(name="backend.worker.flush_last_logins")
+def flush_last_logins():
+    """Write queued user last_login times in one batch."""
+    import asyncio
+    return asyncio.run(_with_redis_closed(_flush_last_logins_async()))
+
+
+async def _flush_last_logins_async():
+    """Async implementation of last login flush."""
+    from backend.services.login_tracking import flush_last_logins
+
+    async with AsyncSessionLocal() as db:
+        try:
+            updated = await flush_last_logins(db)
+            return {"success": True, "updated": updated}
+        except Exception as e:
+            logger.error(f"Last login flush failed: {e}")
+            return {"success": False, "error": str(e)}
+
+
 @celery_app.task(name="backend.worker.backup_database")
 def backup_database():
     """
@@ -2299,7 +2452,7 @@ def calculate_compliance():
         Dict with compliance calculation statistics
     """
     import asyncio
-    return asyncio.run(_calculate_compliance_async())
+    return asyncio.run(_with_redis_closed(_calculate_compliance_async()))
 
 
 async def _calculate_compliance_async():
@@ -0,0 +1,51 @@
+"""Add audit_stats_hourly materialized view
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2025-11-27 09:00:00.000000
+
+Adds an hourly rollup of audit_logs grouped by action, severity and
+username. The audit statistics endpoint sums this small view instead of
+grouping every audit row in the requested window.
+
+The view is refreshed concurrently by the refresh-audit-stats Celery beat
+task, which requires the unique index created below. Usernames fall back
+to users.username for API request logs that only record user_id, and to
+an empty string so the unique index covers every row.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'e5f6g7h8i9j0'
+down_revision = 'd4e5f6g7h8i9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW audit_stats_hourly AS
+        SELECT
+            date_trunc('hour', a.created_at) AS hour,
+            a.action AS action,
+            a.severity AS severity,
+            COALESCE(a.username, u.username, '') AS username,
+            count(*) AS count
+        FROM audit_logs a
+        LEFT OUTER JOIN users u ON u.id = a.user_id
+        GROUP BY 1, 2, 3, 4
+    """)
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'idx_audit_stats_hourly_unique',
+        'audit_stats_hourly',
+        ['hour', 'action', 'severity', 'username'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_stats_hourly_unique', table_name='audit_stats_hourly')
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS audit_stats_hourly")
@@ -0,0 +1,53 @@
+"""Add covering indexes for audit log queries
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2025-11-27 10:00:00.000000
+
+Audit log listings and exports filter on a created_at range plus one of
+user_id/action/severity and order by created_at DESC. This adds:
+- A created_at DESC index that INCLUDEs the commonly filtered columns,
+  so pagination and the raw-table statistics tail can use index-only scans.
+  It supersedes idx_audit_logs_created_at, which is dropped.
+- A partial index over login success/failure events for authentication
+  monitoring queries.
+
+Indexes are built CONCURRENTLY so the audit table stays writable.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'f6g7h8i9j0k1'
+down_revision = 'e5f6g7h8i9j0'
+branch_labels = None
+depends_on = None
+
+LOGIN_ACTIONS = (
+    "'AUTH_LOGIN_SUCCESS', 'AUTH_LOGIN_FAILURE', 'LOGIN_SUCCESS', 'LOGIN_FAILURE'"
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_created_desc_covering "
+            "ON audit_logs (created_at DESC) "
+            "INCLUDE (user_id, action, severity, resource_type, duration_ms)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_login_events "
+            f"ON audit_logs (action, created_at) WHERE action IN ({LOGIN_ACTIONS})"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_logs_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_created_at "
+            "ON audit_logs (created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_logs_login_events")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_logs_created_desc_covering")
@@ -0,0 +1,36 @@
+"""Add partial index for incremental parent backup lookup
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2025-11-27 11:00:00.000000
+
+find_parent_backup looks up the most recent completed FULL backup for a
+source (source_type, source_id) ordered by completed_at DESC. This adds a
+partial index over only completed full backups so the lookup is a single
+index probe instead of a filter + sort over all of a source's backups.
+
+The index is built CONCURRENTLY so the backups table stays writable.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'g7h8i9j0k1l2'
+down_revision = 'f6g7h8i9j0k1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backups_parent_lookup "
+            "ON backups (source_type, source_id, completed_at DESC) "
+            "WHERE backup_mode = 'full' AND status = 'completed'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backups_parent_lookup")
@@ -0,0 +1,28 @@
+"""Add 'deleting' backup status
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2025-11-27 12:00:00.000000
+
+Backup deletion now marks the row 'deleting' and returns immediately;
+a worker task removes the backup from storage and then deletes the row.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'h8i9j0k1l2m3'
+down_revision = 'g7h8i9j0k1l2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block on older PostgreSQL
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE backupstatus ADD VALUE IF NOT EXISTS 'deleting'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop enum values; 'deleting' is left in place
+    pass
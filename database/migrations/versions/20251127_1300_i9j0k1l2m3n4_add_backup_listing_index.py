@@ -0,0 +1,35 @@
+"""Add index for newest-first backup listing
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2025-11-27 13:00:00.000000
+
+The backup list is ordered by (created_at DESC, id DESC) and supports
+keyset pagination with a (created_at, id) cursor. This index lets each
+page be read with a single index range scan instead of sorting the table
+and discarding the skipped rows.
+
+The index is built CONCURRENTLY so the backups table stays writable.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'i9j0k1l2m3n4'
+down_revision = 'h8i9j0k1l2m3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backups_created_at_id "
+            "ON backups (created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backups_created_at_id")
@@ -0,0 +1,41 @@
+"""Add partial indexes for recent completed/running backup listings
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2025-11-27 14:00:00.000000
+
+The dashboard lists recent backups filtered by status, most often
+'completed' (recent backups) and 'running' (in progress). These partial
+indexes cover only those rows, in the list's (created_at DESC, id DESC)
+order, so a filtered page is read from a much smaller index than the
+full-table ix_backups_created_at_id.
+
+The indexes are built CONCURRENTLY so the backups table stays writable.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'j0k1l2m3n4o5'
+down_revision = 'i9j0k1l2m3n4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backups_recent_completed "
+            "ON backups (created_at DESC, id DESC) WHERE status = 'completed'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backups_recent_running "
+            "ON backups (created_at DESC, id DESC) WHERE status = 'running'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backups_recent_running")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backups_recent_completed")
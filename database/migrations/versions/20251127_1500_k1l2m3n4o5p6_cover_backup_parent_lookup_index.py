@@ -0,0 +1,43 @@
+"""Make the parent backup lookup index covering
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2025-11-27 15:00:00.000000
+
+The incremental parent lookup only reads the backup id. Rebuilding
+ix_backups_parent_lookup with INCLUDE (id) lets PostgreSQL answer it
+with an index-only scan instead of visiting the heap row.
+
+The replacement is built CONCURRENTLY under a temporary name, then the
+old index is dropped and the new one renamed, so the backups table stays
+writable and the lookup keeps an index throughout.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'k1l2m3n4o5p6'
+down_revision = 'j0k1l2m3n4o5'
+branch_labels = None
+depends_on = None
+
+
+def _rebuild(include_id: bool) -> None:
+    include = " INCLUDE (id)" if include_id else ""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_backups_parent_lookup_new "
+            f"ON backups (source_type, source_id, completed_at DESC){include} "
+            "WHERE backup_mode = 'full' AND status = 'completed'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_backups_parent_lookup")
+        op.execute("ALTER INDEX ix_backups_parent_lookup_new RENAME TO ix_backups_parent_lookup")
+
+
+def upgrade() -> None:
+    _rebuild(include_id=True)
+
+
+def downgrade() -> None:
+    _rebuild(include_id=False)
@@ -0,0 +1,39 @@
+"""Add (compliance_status, id) indexes for paged compliance listings
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2025-11-27 16:00:00.000000
+
+The VM and container compliance listings are paged by ID, optionally
+filtered by compliance status. These indexes return a filtered page in
+ID order without sorting or scanning the other statuses.
+
+The indexes are built CONCURRENTLY so the tables stay writable.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'l2m3n4o5p6q7'
+down_revision = 'k1l2m3n4o5p6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vms_compliance_status_id "
+            "ON vms (compliance_status, id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_containers_compliance_status_id "
+            "ON containers (compliance_status, id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_containers_compliance_status_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vms_compliance_status_id")
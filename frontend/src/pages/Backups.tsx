@@ -83,7 +83,8 @@ const Backups: React.FC = () => {
 
       const response = await api.get<PaginatedResponse<Backup>>('/backups', { params });
       setBackups(response.data.items);
-      setTotal(response.data.total);
+      // -1 tells TablePagination the total is unknown
+      setTotal(response.data.total ?? -1);
     } catch (err) {
       setError(handleApiError(err));
     } finally {
@@ -128,8 +129,17 @@ const Backups: React.FC = () => {
     if (!backupToDelete) return;
 
     try {
-      await api.delete(`/backups/${backupToDelete.id}`);
-      enqueueSnackbar('Backup deleted successfully', { variant: 'success' });
+      // Storage is reclaimed in the background; the backup stays listed as
+      // deleting until the worker removes it
+      const response = await api.delete<{ message: string; task_id?: string }>(
+        `/backups/${backupToDelete.id}`
+      );
+      setBackups((current) =>
+        current.map((backup) =>
+          backup.id === backupToDelete.id ? { ...backup, status: BackupStatus.DELETING } : backup
+        )
+      );
+      enqueueSnackbar(response.data.message, { variant: 'info' });
       setDeleteDialogOpen(false);
       setBackupToDelete(null);
       // Refresh the list
@@ -149,6 +159,8 @@ const Backups: React.FC = () => {
         return 'info';
       case BackupStatus.PENDING:
         return 'warning';
+      case BackupStatus.DELETING:
+        return 'default';
       default:
         return 'default';
     }
@@ -229,6 +241,7 @@ const Backups: React.FC = () => {
               <MenuItem value={BackupStatus.RUNNING}>Running</MenuItem>
               <MenuItem value={BackupStatus.PENDING}>Pending</MenuItem>
               <MenuItem value={BackupStatus.FAILED}>Failed</MenuItem>
+              <MenuItem value={BackupStatus.DELETING}>Deleting</MenuItem>
             </TextField>
           </Grid>
         </Grid>
@@ -361,7 +374,12 @@ const Backups: React.FC = () => {
                         size="small"
                         color="error"
                         onClick={() => handleDeleteClick(backup)}
-                        disabled={backup.immutable || backup.is_immutable || backup.legal_hold_enabled}
+                        disabled={
+                          backup.status === BackupStatus.DELETING ||
+                          backup.immutable ||
+                          backup.is_immutable ||
+                          backup.legal_hold_enabled
+                        }
                       >
                         <DeleteIcon />
                       </IconButton>
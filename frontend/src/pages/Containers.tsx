@@ -62,7 +62,7 @@ const Containers: React.FC = () => {
 
       const response = await api.get<PaginatedResponse<Container>>('/podman/containers', { params });
       setContainers(response.data.items);
-      setTotal(response.data.total);
+      setTotal(response.data.total ?? -1);
     } catch (err) {
       setError(handleApiError(err));
     } finally {
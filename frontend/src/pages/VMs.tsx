@@ -62,7 +62,7 @@ const VMs: React.FC = () => {
 
       const response = await api.get<PaginatedResponse<VM>>('/kvm/vms', { params });
       setVMs(response.data.items);
-      setTotal(response.data.total);
+      setTotal(response.data.total ?? -1);
     } catch (err) {
       setError(handleApiError(err));
     } finally {
@@ -140,6 +140,7 @@ export const BackupStatus = {
   RUNNING: 'running',
   COMPLETED: 'completed',
   FAILED: 'failed',
+  DELETING: 'deleting',
 } as const;
 
 export type BackupStatus = typeof BackupStatus[keyof typeof BackupStatus];
@@ -466,9 +467,12 @@ export interface DashboardStats {
 // Pagination
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  // null when the endpoint skipped the count (e.g. include_total=false)
+  total: number | null;
   limit: number;
   offset: number;
+  has_more?: boolean;
+  next_cursor?: string | null;
 }
 
 // Settings